@@ -0,0 +1,150 @@
+# Headless archiver: downloads every bulletin of the listing pages into a directory.
+#
+# Usage: python archive.py TARGET_DIR [--url URL ...] [--workers N]
+#
+# Partial downloads are kept as "<name>.part" and resumed with HTTP Range requests,
+# finished files are skipped when their size and ETag still match the server.
+import os, sys, json, argparse, threading
+import http.client as client
+import urllib.parse as parse
+from concurrent.futures import ThreadPoolExecutor
+import utils.scrapper as scrapper
+import utils.settings as settings
+
+
+CHUNK_SIZE = 65536
+INDEX_FILENAME = ".archive.json"
+
+_connections = threading.local()
+_index_lock = threading.Lock()
+
+
+def _connection(url: parse.SplitResult) -> client.HTTPConnection:
+  """Returns the keep-alive connection of the current worker for the host of <url>."""
+  if not hasattr(_connections, "pool"): _connections.pool = {}
+  key = (url.scheme, url.netloc)
+  if key not in _connections.pool:
+    connection_class = client.HTTPSConnection if url.scheme == "https" else client.HTTPConnection
+    _connections.pool[key] = connection_class(url.netloc, timeout=30)
+  return _connections.pool[key]
+
+
+def _request(method: str, url: str, headers: dict = {}, redirects=5) -> client.HTTPResponse:
+  for _ in range(redirects + 1):
+    split_url = parse.urlsplit(url)
+    path = split_url.path + (f"?{split_url.query}" if split_url.query else "")
+    for attempt in range(2):
+      connection = _connection(split_url)
+      try:
+        connection.request(method, path, headers=headers)
+        response = connection.getresponse()
+        break
+      except (client.HTTPException, ConnectionError):
+        connection.close()  # Dropped keep-alive connection: reconnect once
+        if attempt: raise
+    if response.status not in (301, 302, 303, 307, 308): return response
+    response.read()
+    url = parse.urljoin(url, response.headers["Location"])
+  raise client.HTTPException(f"Too many redirects for {url}")
+
+
+def archive_entry(url: str, target_dir: str, index: dict) -> str:
+  """Downloads one bulletin unless it is already complete.
+
+  Args:
+      url (str): Source URL of the bulletin.
+      target_dir (str): Directory receiving the file.
+      index (dict): ETags of the archived files, by file name.
+
+  Returns:
+      str: What was done ("skipped", "downloaded" or "resumed").
+  """
+  filename = os.path.basename(parse.urlsplit(url).path)
+  final_path = os.path.join(target_dir, filename)
+  part_path = f"{final_path}.part"
+  etag = index.get(filename)
+
+  if os.path.exists(final_path):
+    response = _request("HEAD", url)
+    response.read()
+    length, new_etag = response.headers.get("Content-Length"), response.headers.get("ETag")
+    if response.status != 200: return "skipped"  # Unpublished, refused or down: keep what we have
+    if (length is None or int(length) == os.path.getsize(final_path)) and (not etag or not new_etag or etag == new_etag): return "skipped"
+    if os.path.exists(part_path): os.remove(part_path)  # The new version replaces <final_path> once fully downloaded
+    etag = None
+
+  offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+  headers = {}
+  if offset:
+    headers['Range'] = f"bytes={offset}-"
+    if etag: headers['If-Range'] = etag
+  response = _request("GET", url, headers)
+  if response.status == 416:
+    response.read()
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    if total.isdigit() and int(total) == offset:
+      os.replace(part_path, final_path)
+      return "skipped"
+    os.remove(part_path)
+    return archive_entry(url, target_dir, index)
+  if response.status not in (200, 206):
+    response.read()
+    raise client.HTTPException(f"HTTP {response.status} for {url}")
+
+  resumed = response.status == 206
+  total = _expected_size(response, offset if resumed else 0)
+  with _index_lock:
+    index[filename] = response.headers.get("ETag")  # Also guards the resume of the .part file with If-Range
+    _save_index(target_dir, index)
+  with open(part_path, "ab" if resumed else "wb") as file:
+    while chunk := response.read(CHUNK_SIZE): file.write(chunk)
+    size = file.tell()
+  if total is not None and size != total: raise OSError(f"Download ended at {size} of {total} bytes, {part_path} is resumed on the next run")
+  os.replace(part_path, final_path)
+  return "resumed" if resumed else "downloaded"
+
+
+def _expected_size(response: client.HTTPResponse, offset: int) -> int:
+  """Full size of the file once <response> is appended at <offset>, None if the server does not tell."""
+  total = response.headers.get("Content-Range", "").rpartition("/")[2]
+  if response.status == 206 and total.isdigit(): return int(total)
+  length = response.headers.get("Content-Length")
+  return offset + int(length) if length and length.isdigit() else None
+
+
+def _load_index(target_dir: str) -> dict:
+  try:
+    with open(os.path.join(target_dir, INDEX_FILENAME), "r") as file: return json.load(fp=file)
+  except (OSError, ValueError): return {}
+
+
+def _save_index(target_dir: str, index: dict) -> None:
+  index_path = os.path.join(target_dir, INDEX_FILENAME)
+  with open(f"{index_path}.tmp", "w") as file: json.dump(obj=index, fp=file, indent=2)
+  os.replace(f"{index_path}.tmp", index_path)
+
+
+def main(argv: list[str] = None) -> int:
+  parser = argparse.ArgumentParser(description="Downloads every RFI bulletin of the listing pages.")
+  parser.add_argument("target_dir")
+  parser.add_argument("--url", action="append", help="listing page, repeatable, defaults to the ones in settings.json")
+  parser.add_argument("--workers", type=int, default=4)
+  args = parser.parse_args(argv)
+
+  settings.load_settings()
+  os.makedirs(args.target_dir, exist_ok=True)
+  scrapper.load_all(args.url or settings.feed_urls())
+  index = _load_index(args.target_dir)
+  failures = 0
+  with ThreadPoolExecutor(max_workers=args.workers) as executor:
+    futures = {executor.submit(archive_entry, entry.url, args.target_dir, index): entry for entry in scrapper.entries}
+    for future, entry in futures.items():
+      try: print(f"{future.result():<10} {entry.full_title}")
+      except (OSError, client.HTTPException) as e:
+        failures += 1
+        print(f"{'failed':<10} {entry.full_title}: {e}", file=sys.stderr)
+  return 1 if failures else 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,58 @@
+# Compares the listing-page extractor of utils.scrapper with the former BeautifulSoup parse.
+#
+# Usage: python benchmarks/bench_scrapper.py [--repeat N] [--record URL NAME] [fixture.html ...]
+import sys, os, json, time, glob, argparse, tracemalloc
+import urllib.request as request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import utils.scrapper as scrapper
+
+fixtures_path = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def soup_parse(html: str) -> list[dict]:
+  import bs4
+  html_data = bs4.BeautifulSoup(html, "html.parser")
+  return [json.loads(item.contents[0]) for item in html_data.select("div.o-layout-list script")]
+
+
+def measure(function, html: str, repeat: int) -> tuple[float, int, list]:
+  result = function(html)
+  start = time.perf_counter()
+  for _ in range(repeat): function(html)
+  elapsed = (time.perf_counter() - start) / repeat
+  tracemalloc.start()
+  function(html)
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  return elapsed, peak, result
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("fixtures", nargs="*")
+parser.add_argument("--repeat", type=int, default=20)
+parser.add_argument("--record", nargs=2, metavar=("URL", "NAME"))
+args = parser.parse_args()
+
+if args.record:
+  url, name = args.record
+  with request.urlopen(url) as response, open(os.path.join(fixtures_path, f"{name}.html"), "wb") as file: file.write(response.read())
+
+parsers = {"scrapper": scrapper.parse_entries}
+try:
+  import bs4
+  parsers["bs4"] = soup_parse
+except ImportError: print("bs4 not installed, skipping the reference parser", file=sys.stderr)
+
+results = []
+for fixture in args.fixtures or sorted(glob.glob(os.path.join(fixtures_path, "*.html"))):
+  with open(fixture, "r", encoding="utf8") as file: html = file.read()
+  outputs = {}
+  for name, function in parsers.items():
+    elapsed, peak, outputs[name] = measure(function, html, args.repeat)
+    results.append({"fixture": os.path.basename(fixture), "parser": name, "entries": len(outputs[name]), "seconds": elapsed, "peak_bytes": peak})
+    print(f"{os.path.basename(fixture):<30} {name:<10} {len(outputs[name]):>4} entries {elapsed * 1000:>9.2f} ms {peak / 1024:>9.1f} KiB peak")
+  if "bs4" in outputs and outputs["bs4"] != outputs["scrapper"]:
+    sys.exit(f"{fixture}: extracted entries differ from the bs4 reference")
+
+print(json.dumps(results))
@@ -0,0 +1,33 @@
+# Measures the time to the first drawn window and fails when it exceeds the startup budget.
+#
+# Usage: python benchmarks/bench_startup.py [--runs N] [--budget SECONDS]
+#
+# Needs a display. The first run also fills the feed cache, later runs measure a warm start.
+import sys, os, json, argparse, statistics, subprocess
+
+root_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, root_path)
+import utils.settings as settings
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--runs", type=int, default=5)
+parser.add_argument("--budget", type=float, default=settings.json_settings['startup_budget'])
+args = parser.parse_args()
+
+timeline_path = os.path.join(root_path, "startup_timeline.json")
+first_windows, spans = [], {}
+for run in range(args.runs + 1):
+  if os.path.exists(timeline_path): os.remove(timeline_path)  # Never read the timeline of a previous run
+  process = subprocess.run([sys.executable, "main.pyw", "--timeline", "--exit-after-first-window"], cwd=root_path, stderr=subprocess.PIPE, text=True)
+  if process.returncode not in (0, 1) or not os.path.exists(timeline_path):  # 1 only means over budget
+    sys.exit(f"main.pyw failed with exit code {process.returncode}:\n{process.stderr}")
+  with open(timeline_path, "r") as file: timeline = json.load(fp=file)
+  if run == 0: continue  # Cold run, only warms the caches
+  first_windows.append(timeline['first_window'])
+  for item in timeline['spans']: spans.setdefault(item['name'], []).append(item['end'] - item['start'])
+
+for name, durations in spans.items(): print(f"{statistics.median(durations) * 1000:8.1f} ms  {name}")
+median = statistics.median(first_windows)
+print(json.dumps({'first_window_median': median, 'first_window_max': max(first_windows), 'budget': args.budget}))
+if median > args.budget: sys.exit(f"First window after {median:.3f} s, over the {args.budget:.3f} s budget")
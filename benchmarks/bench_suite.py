@@ -0,0 +1,133 @@
+# Runs the networked benchmarks against the local RFI stand-in (benchmarks/server.py) and prints JSON results.
+#
+# Usage: python benchmarks/bench_suite.py [--runs N] [--latency SECONDS] [--rate BYTES_PER_SECOND]
+#                                         [--backend-latency SECONDS] [--output results.json] [--compare baseline.json]
+#
+# Measures scrapper.load (cold and revalidated), time to first audio through MP3Handler, download throughput
+# (single stream and range segments) and the handler side of a UI tick. Playback goes through SimulatedBackend
+# so it runs headless. Results of two versions are compared with --compare.
+import sys, os, json, time, argparse, platform, statistics, subprocess
+
+root_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, root_path)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import utils.scrapper as scrapper
+from utils.mp3handler import MP3Handler
+from utils.backends import SimulatedBackend
+from server import StandInServer, LISTING_PATH
+
+
+def _summary(samples: list[float]) -> dict:
+  samples = sorted(samples)
+  return {'median': statistics.median(samples), 'min': samples[0], 'max': samples[-1], 'p95': samples[min(len(samples) - 1, int(len(samples) * 0.95))]}
+
+
+def bench_scrapper_load(server: StandInServer, runs: int) -> dict:
+  cold, revalidated = [], []
+  for _ in range(runs):
+    scrapper.entries, scrapper.index, scrapper.feeds, scrapper.validators = [], {}, {}, {}
+    start = time.perf_counter()
+    entries = scrapper.load(server.url + LISTING_PATH)
+    cold.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    scrapper.load(server.url + LISTING_PATH)
+    revalidated.append(time.perf_counter() - start)
+  return {'entries': len(entries), 'cold_seconds': _summary(cold), 'revalidated_seconds': _summary(revalidated)}
+
+
+def bench_first_audio(server: StandInServer, runs: int, buffer_threshold: int, backend_latency: float) -> dict:
+  samples = []
+  for run in range(runs):
+    start = time.perf_counter()
+    handler = MP3Handler(f"{server.url}/audio/first-audio-{run}.mp3", buffer_threshold=buffer_threshold, backend=SimulatedBackend(backend_latency))
+    handler.stream_MP3()
+    handler.load_MP3()
+    handler.play()
+    samples.append(time.perf_counter() - start)
+    handler.close()
+  return {'buffer_threshold': buffer_threshold, 'seconds': _summary(samples)}
+
+
+def bench_throughput(server: StandInServer, runs: int, segments: int) -> dict:
+  samples, size = [], 0
+  for run in range(runs):
+    handler = MP3Handler(f"{server.url}/audio/throughput-{run}.mp3", backend=SimulatedBackend())
+    start = time.perf_counter()
+    handler.download_MP3(segments)
+    samples.append(handler.downloaded_bytes / (time.perf_counter() - start))
+    size = handler.downloaded_bytes
+    handler.close()
+  return {'segments': segments, 'bytes': size, 'bytes_per_second': _summary(samples)}
+
+
+def bench_tick(server: StandInServer, ticks: int, backend_latency: float) -> dict:
+  """Replays the handler side of mainwindow._on_tick (element updates need a display and are left out)."""
+  handler = MP3Handler(f"{server.url}/audio/tick.mp3", backend=SimulatedBackend(backend_latency))
+  handler.stream_MP3()
+  handler.load_MP3()
+  handler.play()
+  samples, calls = [], handler.backend_calls
+  for _ in range(ticks):
+    start = time.perf_counter()
+    state = handler.snapshot()
+    handler.update_buffer(state)
+    f"{time.strftime('%M:%S', time.gmtime(state.position))} / {time.strftime('%M:%S', time.gmtime(state.duration))}"
+    samples.append(time.perf_counter() - start)
+  calls = handler.backend_calls - calls
+  handler.close()
+  return {'ticks': ticks, 'backend_calls_per_tick': calls / ticks, 'milliseconds': _summary([sample * 1000 for sample in samples])}
+
+
+def _flatten(results: dict, prefix="") -> dict:
+  flat = {}
+  for key, value in results.items():
+    if isinstance(value, dict): flat.update(_flatten(value, f"{prefix}{key}."))
+    elif isinstance(value, (int, float)): flat[f"{prefix}{key}"] = value
+  return flat
+
+
+def compare(baseline: dict, results: dict) -> None:
+  old, new = _flatten(baseline['results']), _flatten(results['results'])
+  print(f"{'metric':<55} {baseline['version']:>12} {results['version']:>12} {'ratio':>8}", file=sys.stderr)
+  for key in new:
+    if key in old: print(f"{key:<55} {old[key]:>12.4g} {new[key]:>12.4g} {new[key] / old[key] if old[key] else float('nan'):>8.2f}", file=sys.stderr)
+
+
+def _version() -> str:
+  try: return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=root_path, capture_output=True, text=True).stdout.strip() or "unknown"
+  except OSError: return "unknown"
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--runs", type=int, default=5)
+parser.add_argument("--ticks", type=int, default=1000)
+parser.add_argument("--fixture", default="journaux-monde.html")
+parser.add_argument("--latency", type=float, default=0.05)
+parser.add_argument("--rate", type=int, default=1048576)
+parser.add_argument("--duration", type=float, default=60.0)
+parser.add_argument("--buffer-threshold", type=int, default=262144)
+parser.add_argument("--backend-latency", type=float, default=0.0)
+parser.add_argument("--output")
+parser.add_argument("--compare")
+args = parser.parse_args()
+
+server = StandInServer(fixture=args.fixture, latency=args.latency, rate=args.rate, duration=args.duration).start()
+results = {
+  'version': _version(),
+  'python': platform.python_version(),
+  'config': {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+  'results': {
+    'scrapper_load': bench_scrapper_load(server, args.runs),
+    'first_audio': bench_first_audio(server, args.runs, args.buffer_threshold, args.backend_latency),
+    'throughput_single': bench_throughput(server, args.runs, 1),
+    'throughput_segmented': bench_throughput(server, args.runs, 4),
+    'tick': bench_tick(server, args.ticks, args.backend_latency),
+  },
+}
+server.shutdown()
+
+if args.output:
+  with open(args.output, "w") as file: json.dump(obj=results, fp=file, indent=2)
+if args.compare:
+  with open(args.compare, "r") as file: compare(json.load(fp=file), results)
+print(json.dumps(results))
@@ -0,0 +1,136 @@
+# Local stand-in for the RFI listing page and its MP3 CDN.
+#
+# Usage: python benchmarks/server.py [--port 8000] [--latency SECONDS] [--rate BYTES_PER_SECOND] [--duration SECONDS]
+#
+# Serves "/fr/journaux-monde/" from a fixture, with every MP3 link rewritten to "/audio/<name>.mp3".
+# Audio files are synthetic 128 kbps MPEG 1 layer III streams. ETag, If-None-Match, Range and
+# If-Range are honoured, every response waits <latency> and bodies are throttled to <rate>.
+import os, re, sys, time, random, hashlib, argparse, threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from utils.ranges import parse_range
+
+fixtures_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+LISTING_PATH = "/fr/journaux-monde/"
+_FRAME_HEADER = b"\xff\xfb\x90\x64"  # MPEG 1 layer III, 128 kbps, 44.1 kHz, stereo: 417 bytes per frame
+
+
+def synthetic_mp3(name: str, duration: float) -> bytes:
+  """Builds a decodable-looking MP3 (valid frame headers, random payload) of about <duration> seconds."""
+  generator = random.Random(name)
+  frames = int(duration * 44100 / 1152)
+  return b"".join(_FRAME_HEADER + generator.randbytes(413) for _ in range(frames))
+
+
+class StandInServer(ThreadingHTTPServer):
+  daemon_threads = True
+
+
+  def __init__(self, port=0, fixture="journaux-monde.html", latency=0.0, rate=0, duration=60.0) -> None:
+    super().__init__(("127.0.0.1", port), _Handler)
+    self.latency = latency
+    self.rate = rate
+    self.duration = duration
+    self.requests = 0
+    self._audio = {}
+    self._lock = threading.Lock()
+    with open(os.path.join(fixtures_path, fixture), "r", encoding="utf8") as file:
+      self.listing = re.sub(r"https?://[^\"']+/([^/\"']+\.mp3)", lambda match: f"{self.url}/audio/{match.group(1)}", file.read()).encode("utf8")
+
+
+  @property
+  def url(self) -> str:
+    return f"http://127.0.0.1:{self.server_port}"
+
+
+  def audio(self, name: str) -> bytes:
+    with self._lock:
+      if name not in self._audio: self._audio[name] = synthetic_mp3(name, self.duration)
+      return self._audio[name]
+
+
+  def start(self) -> "StandInServer":
+    threading.Thread(target=self.serve_forever, daemon=True).start()
+    return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  server: StandInServer
+
+
+  def do_HEAD(self):
+    self._serve(send_body=False)
+
+
+  def do_GET(self):
+    self._serve(send_body=True)
+
+
+  def _serve(self, send_body: bool):
+    self.server.requests += 1
+    if self.server.latency: time.sleep(self.server.latency)
+    if self.path == LISTING_PATH: data, content_type = self.server.listing, "text/html; charset=utf-8"
+    elif self.path.startswith("/audio/") and self.path.endswith(".mp3"): data, content_type = self.server.audio(self.path[7:]), "audio/mpeg"
+    else:
+      self.send_response(404)
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+      return
+    etag = '"{}"'.format(hashlib.sha1(data).hexdigest()[:16])
+
+    if self.headers.get("If-None-Match") == etag:
+      self.send_response(304)
+      self.send_header("ETag", etag)
+      self.end_headers()
+      return
+    start, end, status = 0, len(data) - 1, 200
+    byte_range = parse_range(self.headers.get("Range", ""), len(data))
+    if byte_range and self.headers.get("If-Range", etag) == etag:
+      start, end = byte_range
+      if start > end:
+        self.send_response(416)
+        self.send_header("Content-Range", f"bytes */{len(data)}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return
+      status = 206
+
+    self.send_response(status)
+    self.send_header("Content-Type", content_type)
+    self.send_header("Content-Length", str(end - start + 1))
+    self.send_header("Accept-Ranges", "bytes")
+    self.send_header("ETag", etag)
+    if status == 206: self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+    self.end_headers()
+    if send_body: self._write_throttled(memoryview(data)[start:end + 1])
+
+
+  def _write_throttled(self, body: memoryview):
+    chunk_size = 16384
+    started = time.perf_counter()
+    try:
+      for offset in range(0, len(body), chunk_size):
+        self.wfile.write(body[offset:offset + chunk_size])
+        if self.server.rate:
+          delay = started + (offset + chunk_size) / self.server.rate - time.perf_counter()
+          if delay > 0: time.sleep(delay)
+    except ConnectionError: pass
+
+
+  def log_message(self, format, *args):
+    pass
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--port", type=int, default=8000)
+  parser.add_argument("--fixture", default="journaux-monde.html")
+  parser.add_argument("--latency", type=float, default=0.0)
+  parser.add_argument("--rate", type=int, default=0)
+  parser.add_argument("--duration", type=float, default=600.0)
+  args = parser.parse_args()
+  server = StandInServer(args.port, args.fixture, args.latency, args.rate, args.duration)
+  print(f"Listing page: {server.url}{LISTING_PATH}", file=sys.stderr)
+  server.serve_forever()
@@ -0,0 +1,261 @@
+# Local daemon shared by every player instance: scrapes the listing pages, downloads and caches bulletins once.
+#
+# Usage: python daemon.py [--port 8765] [--prefetch N]
+#
+# Players use it when settings.json has "daemon": "http://127.0.0.1:8765". It serves the merged listing page
+# at LISTING_PATH, with audio links pointing to "/audio/<cache key>.mp3". Concurrent requests for the same
+# bulletin share one upstream download and are served from memory as the bytes arrive (Range supported).
+import os, sys, json, hashlib, argparse, threading
+import urllib.request as request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import utils.scrapper as scrapper
+import utils.settings as settings
+from utils.cache import EpisodeCache
+from utils.poller import FeedPoller
+from utils.ranges import parse_range
+
+
+LISTING_PATH = settings.DAEMON_LISTING_PATH
+CHUNK_SIZE = 65536
+
+
+class Fetch():
+  def __init__(self, url: str, cache: EpisodeCache, on_done=None) -> None:
+    """One upstream download, read concurrently by any number of clients while it progresses.
+
+    Args:
+        url (str): Source URL of the bulletin.
+        cache (EpisodeCache): Cache receiving the file once complete.
+        on_done (callable, optional): Called from the download thread with this fetch when it ends. Defaults to None.
+    """
+    self.url = url
+    self.cache = cache
+    self.on_done = on_done
+    self.data = bytearray()
+    self.total_bytes = 0
+    self.etag = None
+    self.clients = 0
+    self.error: Exception = None
+    self.done = False
+    self.started = threading.Event()
+    self._condition = threading.Condition()
+    self._thread = threading.Thread(target=self._run, daemon=True)
+
+
+  def start(self) -> "Fetch":
+    self._thread.start()
+    return self
+
+
+  def _run(self) -> None:
+    try:
+      with request.urlopen(self.url, timeout=30) as response:
+        self.total_bytes = int(response.headers.get("Content-Length", 0))
+        self.etag = response.headers.get("ETag")
+        self.started.set()
+        while chunk := response.read(CHUNK_SIZE):
+          with self._condition:
+            self.data += chunk
+            self._condition.notify_all()
+      if self.total_bytes and len(self.data) != self.total_bytes: raise OSError(f"Download ended at {len(self.data)} of {self.total_bytes} bytes")
+      self.cache.store_data(self.url, self.data, self.etag)
+    except Exception as e: self.error = e
+    finally:
+      with self._condition:
+        self.done = True
+        self._condition.notify_all()
+      self.started.set()
+      if self.on_done: self.on_done(self)
+
+
+  def read(self, start: int, end: int):
+    """Yields the bytes from <start> to <end> (inclusive), waiting for them to arrive."""
+    position = end_position = start
+    while position <= end:
+      with self._condition:
+        while len(self.data) <= position and not self.done: self._condition.wait()
+        end_position = min(len(self.data), end + 1)
+        if position >= end_position: return  # Download failed or shorter than announced
+        chunk = bytes(self.data[position:min(end_position, position + CHUNK_SIZE)])
+      position += len(chunk)
+      yield chunk
+
+
+class Daemon(ThreadingHTTPServer):
+  daemon_threads = True
+
+
+  def __init__(self, port: int, urls: list[str], feed_cache: str, cache: EpisodeCache, prefetch_count=0) -> None:
+    super().__init__(("127.0.0.1", port), _Handler)
+    self.urls = urls
+    self.feed_cache = feed_cache
+    self.cache = cache
+    self.prefetch_count = prefetch_count
+    self.fetches: dict[str, Fetch] = {}
+    self.coalesced = 0
+    self._lock = threading.Lock()
+    self._poller = FeedPoller(urls, feed_cache, lambda new_entries: self.prefetch(), settings.json_settings['poll_interval'], settings.json_settings['poll_max_backoff'])
+
+
+  def start(self) -> None:
+    if not scrapper.load_cached(self.urls, self.feed_cache): scrapper.load_all(self.urls, self.feed_cache)
+    self._poller.start()
+    self.prefetch()
+
+
+  def fetch(self, url: str) -> Fetch:
+    """Returns the running download of <url>, starting one if there is none."""
+    with self._lock:
+      fetch = self.fetches.get(url)
+      if fetch is None or fetch.error: fetch = self.fetches[url] = Fetch(url, self.cache, self.release).start()
+      else: self.coalesced += 1
+      fetch.clients += 1
+    return fetch
+
+
+  def release(self, fetch: Fetch, client=False) -> None:
+    """Forgets a finished fetch once its last client is gone, the cache serving later requests."""
+    with self._lock:
+      if client: fetch.clients -= 1
+      if fetch.done and not fetch.clients and self.fetches.get(fetch.url) is fetch: del self.fetches[fetch.url]
+
+
+  def prefetch(self) -> None:
+    for entry in scrapper.entries[:self.prefetch_count]:
+      if self.cache.lookup(entry.url, revalidate=False) is None: self.release(self.fetch(entry.url), client=True)
+
+
+  def source_url(self, key: str) -> str:
+    return next((entry.url for entry in scrapper.entries if self.cache.key(entry.url) == key), None)
+
+
+  def listing(self, base_url: str) -> bytes:
+    """Renders the merged entries as an RFI-like listing page that scrapper.load() can read."""
+    items = {item['sources'][0]['url']: item for items in scrapper.feeds.values() for item in items}
+    scripts = []
+    for entry in scrapper.entries:
+      item = items[entry.url]
+      item = {**item, 'sources': [{**item['sources'][0], 'url': f"{base_url}/audio/{self.cache.key(entry.url)}.mp3"}]}
+      payload = json.dumps(item).replace("</", "<\\/")
+      scripts.append(f'<script type="application/json">{payload}</script>')
+    return f'<!DOCTYPE html><html><body><div class="o-layout-list">{"".join(scripts)}</div></body></html>'.encode("utf8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  server: Daemon
+
+
+  def do_HEAD(self):
+    self._serve(send_body=False)
+
+
+  def do_GET(self):
+    self._serve(send_body=True)
+
+
+  def _serve(self, send_body: bool):
+    if self.path == LISTING_PATH: self._serve_listing(send_body)
+    elif self.path.startswith("/audio/") and self.path.endswith(".mp3"):
+      url = self.server.source_url(self.path[7:-4])
+      if url is None: self._send_empty(404)
+      else: self._serve_audio(url, send_body)
+    else: self._send_empty(404)
+
+
+  def _serve_listing(self, send_body: bool):
+    data = self.server.listing(f"http://{self.headers.get('Host', '127.0.0.1:%d' % self.server.server_port)}")
+    etag = '"{}"'.format(hashlib.sha1(data).hexdigest()[:16])
+    if self.headers.get("If-None-Match") == etag:
+      self._send_empty(304, {"ETag": etag})
+      return
+    self.send_response(200)
+    self.send_header("Content-Type", "text/html; charset=utf-8")
+    self.send_header("Content-Length", str(len(data)))
+    self.send_header("ETag", etag)
+    self.end_headers()
+    if send_body: self.wfile.write(data)
+
+
+  def _serve_audio(self, url: str, send_body: bool):
+    cached_filename = self.server.cache.lookup(url, revalidate=False)
+    if cached_filename is not None:
+      with open(cached_filename, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        start, end = self._send_audio_headers(size, None)
+        if start is None or not send_body: return
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0 and (chunk := file.read(min(CHUNK_SIZE, remaining))):
+          self.wfile.write(chunk)
+          remaining -= len(chunk)
+      return
+
+    fetch = self.server.fetch(url)
+    try:
+      fetch.started.wait()
+      if fetch.error and not fetch.data:
+        self._send_empty(502)
+        return
+      start, end = self._send_audio_headers(fetch.total_bytes, fetch.etag)
+      if start is None or not send_body: return
+      for chunk in fetch.read(start, end if end is not None else sys.maxsize): self.wfile.write(chunk)
+      if end is None: self.close_connection = True
+    except ConnectionError: pass
+    finally: self.server.release(fetch, client=True)
+
+
+  def _send_audio_headers(self, size: int, etag: str) -> tuple[int, int]:
+    """Sends a 200 or 206 answer for <size> bytes and returns the byte range to write, (None, None) if no body."""
+    start, end, status = 0, size - 1 if size else None, 200
+    range_header = self.headers.get("Range")
+    byte_range = parse_range(range_header, size) if range_header and size else None
+    if byte_range and (etag is None or self.headers.get("If-Range", etag) == etag):
+      start, end = byte_range
+      if start > end:
+        self._send_empty(416, {"Content-Range": f"bytes */{size}"})
+        return None, None
+      status = 206
+    self.send_response(status)
+    self.send_header("Content-Type", "audio/mpeg")
+    if size:
+      self.send_header("Content-Length", str(end - start + 1))
+      self.send_header("Accept-Ranges", "bytes")
+    else: self.send_header("Connection", "close")
+    if etag: self.send_header("ETag", etag)
+    if status == 206: self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+    self.end_headers()
+    return start, end
+
+
+  def _send_empty(self, status: int, headers: dict = {}):
+    self.send_response(status)
+    for name, value in headers.items(): self.send_header(name, value)
+    self.send_header("Content-Length", "0")
+    self.end_headers()
+
+
+  def log_message(self, format, *args):
+    pass
+
+
+def main(argv: list[str] = None) -> int:
+  parser = argparse.ArgumentParser(description="Serves the RFI listing pages and bulletins to local player instances.")
+  parser.add_argument("--port", type=int, default=8765)
+  parser.add_argument("--prefetch", type=int, help="newest bulletins downloaded ahead, defaults to prefetch_count of settings.json")
+  parser.add_argument("--feed-cache", default="daemon-feed.json", help="kept apart from the feed cache of the players")
+  args = parser.parse_args(argv)
+
+  settings.load_settings()
+  cache = EpisodeCache(settings.json_settings['cache_dir'], settings.json_settings['cache_max_bytes'], settings.json_settings['cache_max_age'])
+  prefetch_count = settings.json_settings['prefetch_count'] if args.prefetch is None else args.prefetch
+  daemon = Daemon(args.port, settings.feed_urls(), args.feed_cache, cache, prefetch_count)
+  daemon.start()
+  print(f"Listening on http://127.0.0.1:{args.port}{LISTING_PATH}", file=sys.stderr)
+  try: daemon.serve_forever()
+  except KeyboardInterrupt: pass
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -5,8 +5,11 @@
 # - Cleaned code (again)
 
 
-import PySimpleGUI as sg
-import windows.mainwindow as mainwindow
+import sys
+import utils.timeline as timeline
+import utils.tracing as tracing
+with timeline.span("import PySimpleGUI"): import PySimpleGUI as sg
+with timeline.span("import windows.mainwindow"): import windows.mainwindow as mainwindow
 import utils.images as images
 import utils.settings as settings
 
@@ -15,9 +18,12 @@ __version__ = "1.5"
 __program_title__ = f"RFI News Player v{__version__}"
 
 
-settings.load_settings()
-sg.SetGlobalIcon(images.base64_app)
-sg.theme(settings.json_settings['theme'])
+with timeline.span("load settings"): settings.load_settings()
+tracing.configure(settings.json_settings['trace_file'], settings.json_settings['trace_max_bytes'], settings.json_settings['trace_backups'], settings.json_settings['trace'])
+with timeline.span("set icon and theme"):
+  sg.SetGlobalIcon(images.base64_app)
+  sg.theme(settings.json_settings['theme'])
 mainwindow.window_title = __program_title__
 mainwindow.show()
-settings.save_settings()
\ No newline at end of file
+settings.save_settings()
+if timeline.enabled: sys.exit(0 if timeline.report(budget=settings.json_settings['startup_budget']) else 1)
\ No newline at end of file
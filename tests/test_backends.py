@@ -0,0 +1,54 @@
+import sys, os, types
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from utils.backends import MemoryBackend
+
+
+class _FakeMusic():
+  """Follows pygame.mixer.music: get_pos() counts from play(), stands still while paused and is not reset by unpause()."""
+  def __init__(self) -> None:
+    self.now = 0.0
+    self._played = 0.0
+    self._since = None
+
+
+  def get_pos(self) -> int:
+    return int((self._played + (self.now - self._since if self._since is not None else 0.0)) * 1000)
+
+
+  def play(self, start=0.0) -> None:
+    self._played, self._since = 0.0, self.now
+
+
+  def pause(self) -> None:
+    self._played, self._since = self.get_pos() / 1000, None
+
+
+  def unpause(self) -> None:
+    self._since = self.now
+
+
+  def load(self, *args) -> None: pass
+  def get_busy(self) -> bool: return True
+
+
+def memory_backend(monkeypatch) -> MemoryBackend:
+  music = _FakeMusic()
+  pygame = types.SimpleNamespace(error=Exception, mixer=types.SimpleNamespace(init=lambda: None, music=music))
+  monkeypatch.setitem(sys.modules, "pygame", pygame)
+  return MemoryBackend()
+
+
+def test_position_after_pause_and_resume(monkeypatch):
+  backend = memory_backend(monkeypatch)
+  music = backend._music
+  backend.play()
+  music.now += 10
+  backend.pause()
+  assert backend.position() == 10
+  music.now += 100
+  backend.resume()
+  music.now += 5
+  assert backend.position() == 15
+  backend.seek(30)
+  music.now += 2
+  assert backend.position() == 32
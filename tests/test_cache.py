@@ -0,0 +1,58 @@
+import sys, os, time, threading, socketserver
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from utils.cache import EpisodeCache
+
+
+def test_store_and_lookup(tmp_path):
+  cache = EpisodeCache(str(tmp_path), max_bytes=1000)
+  path = cache.store_data("http://example/a.mp3", b"a" * 100, '"etag"')
+  assert cache.lookup("http://example/a.mp3", revalidate=False) == path
+  assert cache.lookup("http://example/b.mp3", revalidate=False) is None
+  assert EpisodeCache(str(tmp_path), max_bytes=1000).lookup("http://example/a.mp3", revalidate=False) == path  # Index persisted
+
+
+def test_evicts_least_recently_used(tmp_path):
+  cache = EpisodeCache(str(tmp_path), max_bytes=250)
+  cache.store_data("http://example/a.mp3", b"a" * 100)
+  cache.store_data("http://example/b.mp3", b"b" * 100)
+  for age, url in ((30, "http://example/a.mp3"), (20, "http://example/b.mp3")): cache._index[cache.key(url)]['last_used'] -= age
+  cache.lookup("http://example/a.mp3", revalidate=False)  # <b> becomes the least recently used
+  cache.store_data("http://example/c.mp3", b"c" * 100)
+  assert cache.lookup("http://example/b.mp3", revalidate=False) is None
+  assert cache.lookup("http://example/a.mp3", revalidate=False) is not None
+  assert cache.lookup("http://example/c.mp3", revalidate=False) is not None
+  assert not os.path.exists(cache.path("http://example/b.mp3"))
+
+
+def test_evicts_expired(tmp_path):
+  cache = EpisodeCache(str(tmp_path), max_bytes=1000, max_age=60)
+  cache.store_data("http://example/a.mp3", b"a" * 100)
+  cache._index[cache.key("http://example/a.mp3")]['created'] = time.time() - 120
+  cache.store_data("http://example/b.mp3", b"b" * 100)
+  assert cache.lookup("http://example/a.mp3", revalidate=False) is None
+  assert cache.lookup("http://example/b.mp3", revalidate=False) is not None
+
+
+def test_lookup_misses_expired(tmp_path):
+  cache = EpisodeCache(str(tmp_path), max_bytes=1000, max_age=60)
+  cache.store_data("http://example/a.mp3", b"a" * 100)
+  cache._index[cache.key("http://example/a.mp3")]['created'] = time.time() - 120
+  assert cache.lookup("http://example/a.mp3", revalidate=False) is None
+  assert not os.path.exists(cache.path("http://example/a.mp3"))
+
+
+class _GarbledHandler(socketserver.StreamRequestHandler):
+  def handle(self):
+    self.rfile.readline()
+    self.wfile.write(b"garbage\r\n\r\n")
+
+
+def test_revalidate_trusts_cache_on_garbled_answer(tmp_path):
+  server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _GarbledHandler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  url = f"http://127.0.0.1:{server.server_address[1]}/a.mp3"
+  cache = EpisodeCache(str(tmp_path), max_bytes=1000)
+  path = cache.store_data(url, b"a" * 100)
+  assert cache.lookup(url) == path
+  server.shutdown()
+  server.server_close()
@@ -0,0 +1,87 @@
+import sys, os, time, threading
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from utils.mp3handler import MP3Handler
+from utils.backends import SimulatedBackend
+
+
+class _TruncatingHandler(BaseHTTPRequestHandler):
+  """Announces 100000 bytes and closes the connection after 4134."""
+  protocol_version = "HTTP/1.1"
+
+
+  def do_GET(self):
+    self.send_response(200)
+    self.send_header("Content-Length", "100000")
+    self.end_headers()
+    self.wfile.write(b"\xff\xfb\x90\x64" + bytes(4130))
+    self.close_connection = True
+
+
+  def log_message(self, format, *args):
+    pass
+
+
+class _FailingRangeHandler(BaseHTTPRequestHandler):
+  """Refuses the first range of a 400000 bytes file and sends the other ones at 80 kB/s."""
+  protocol_version = "HTTP/1.1"
+
+
+  def do_HEAD(self):
+    self.send_response(200)
+    self.send_header("Content-Length", "400000")
+    self.send_header("Accept-Ranges", "bytes")
+    self.end_headers()
+
+
+  def do_GET(self):
+    start, _, end = self.headers["Range"].removeprefix("bytes=").partition("-")
+    if start == "0":
+      self.send_response(500)
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+      return
+    self.send_response(206)
+    self.send_header("Content-Length", str(int(end) - int(start) + 1))
+    self.send_header("Content-Range", f"bytes {start}-{end}/400000")
+    self.end_headers()
+    try:
+      for _ in range(0, int(end) - int(start) + 1, 8000):
+        self.wfile.write(bytes(8000))
+        time.sleep(0.1)
+    except ConnectionError: pass
+
+
+  def log_message(self, format, *args):
+    pass
+
+
+def serve(handler_class) -> ThreadingHTTPServer:
+  server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+  server.daemon_threads = True
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  return server
+
+
+def test_stream_ended_early_is_an_error():
+  server = serve(_TruncatingHandler)
+  handler = MP3Handler(f"http://127.0.0.1:{server.server_port}/a.mp3", backend=SimulatedBackend())
+  handler.start_stream()
+  handler._download_thread.join(10)
+  assert isinstance(handler.Error, OSError)
+  assert not handler.Downloading
+  assert handler.downloaded_bytes == 4134
+  handler.close()
+  server.shutdown()
+
+
+def test_failed_segment_stops_the_others():
+  server = serve(_FailingRangeHandler)
+  handler = MP3Handler(f"http://127.0.0.1:{server.server_port}/a.mp3", backend=SimulatedBackend())
+  started = time.monotonic()
+  with pytest.raises(OSError): handler.download_MP3(segments=4)
+  assert time.monotonic() - started < 1  # The other segments need more than a second to complete
+  assert handler.downloaded_bytes < 300000
+  handler.close()
+  server.shutdown()
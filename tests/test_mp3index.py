@@ -0,0 +1,77 @@
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from utils.mp3index import FrameIndex, parse_header
+
+
+FRAME_HEADER = b"\xff\xfb\x90\x64"  # MPEG 1 layer III, 128 kbps, 44.1 kHz, joint stereo
+FRAME_LENGTH = 417
+FRAME_SECONDS = 1152 / 44100
+
+
+def cbr_frames(count: int) -> bytes:
+  return b"".join(FRAME_HEADER + bytes([index % 251]) * (FRAME_LENGTH - 4) for index in range(count))
+
+
+def id3_tag(size: int) -> bytes:
+  syncsafe = bytes([(size >> 21) & 0x7f, (size >> 14) & 0x7f, (size >> 7) & 0x7f, size & 0x7f])
+  return b"ID3\x03\x00\x00" + syncsafe + b"\xff\xfb" * (size // 2)  # Sync-like bytes inside the tag must be skipped
+
+
+def xing_frame(frames: int, audio_bytes: int) -> bytes:
+  toc = bytes(min(255, index * 256 // 100) for index in range(100))
+  tag = b"Xing" + (0x7).to_bytes(4, "big") + frames.to_bytes(4, "big") + audio_bytes.to_bytes(4, "big") + toc
+  frame = FRAME_HEADER + bytes(32) + tag
+  return frame + bytes(FRAME_LENGTH - len(frame))
+
+
+def index_of(data: bytes, chunk_size: int) -> FrameIndex:
+  index = FrameIndex(len(data))
+  for start in range(0, len(data), chunk_size): index.feed(data[start:start + chunk_size])
+  return index
+
+
+def test_parse_header():
+  header = parse_header(FRAME_HEADER)
+  assert (header.bitrate, header.sample_rate, header.samples, header.length, header.side_info) == (128000, 44100, 1152, FRAME_LENGTH, 32)
+  assert parse_header(b"\xff\xfb\xf0\x64") is None  # Bitrate index 15 is invalid
+
+
+def test_cbr_without_xing():
+  index = index_of(cbr_frames(100), 4096)
+  assert index.audio_start == 0
+  assert index.frames == 100
+  assert index.xing_frames == 0
+  assert abs(index.duration - 100 * FRAME_SECONDS) < 1e-9
+  assert index.offset_for(1.0) == 39 * FRAME_LENGTH  # First frame starting at or after 1 s
+  assert index.needed_range(1.0, 100 * FRAME_LENGTH) is None
+
+
+def test_cbr_estimate_before_complete():
+  data = cbr_frames(100)
+  index = FrameIndex(len(data))
+  index.feed(data[:10 * FRAME_LENGTH])
+  assert not index.complete
+  assert abs(index.duration - len(data) * 8 / 128000) < 1e-9
+  assert index.needed_range(2.0, 10 * FRAME_LENGTH) == (int(2.0 * 128000 / 8), len(data) - 1)
+
+
+def test_id3_and_xing():
+  tag = id3_tag(100)
+  data = tag + xing_frame(100, 100 * FRAME_LENGTH) + cbr_frames(100)
+  index = FrameIndex(len(data))
+  index.feed(data[:len(tag) + FRAME_LENGTH + 10])
+  assert index.audio_start == len(tag)
+  assert abs(index.duration - 100 * FRAME_SECONDS) < 1e-9  # Known from the Xing header before the audio arrives
+  assert index.toc is not None
+  index.feed(data[len(tag) + FRAME_LENGTH + 10:])
+  assert index.frames == 100  # The Xing frame carries no audio
+  assert index.offset_for(1.0) == len(tag) + FRAME_LENGTH + 39 * FRAME_LENGTH
+
+
+def test_chunk_size_does_not_matter():
+  for data in (cbr_frames(60), id3_tag(100) + xing_frame(60, 60 * FRAME_LENGTH) + cbr_frames(60)):
+    reference = index_of(data, len(data))
+    for chunk_size in (1, 3, 417, 1000):
+      index = index_of(data, chunk_size)
+      assert (index.audio_start, index.frames, index.samples, index.xing_frames) == (reference.audio_start, reference.frames, reference.samples, reference.xing_frames)
+      assert [index.offset_for(seconds) for seconds in (0.0, 0.5, 1.0, 1.5)] == [reference.offset_for(seconds) for seconds in (0.0, 0.5, 1.0, 1.5)]
@@ -0,0 +1,23 @@
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from utils.ranges import parse_range
+
+
+def test_ranges():
+  assert parse_range("bytes=0-99", 1000) == (0, 99)
+  assert parse_range("bytes=900-", 1000) == (900, 999)
+  assert parse_range("bytes=900-5000", 1000) == (900, 999)
+  assert parse_range("bytes=-500", 1000) == (500, 999)
+  assert parse_range("bytes=-5000", 1000) == (0, 999)
+
+
+def test_unsatisfiable_ranges_start_past_the_end():
+  start, end = parse_range("bytes=1000-", 1000)
+  assert start > end
+  start, end = parse_range("bytes=-0", 1000)
+  assert start > end
+
+
+def test_malformed_ranges_are_ignored():
+  for header in ("", "bytes=", "bytes=-", "bytes=a-b", "bytes=10-5", "bytes=0-1,5-9", "items=0-9"):
+    assert parse_range(header, 1000) is None
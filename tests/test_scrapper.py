@@ -0,0 +1,43 @@
+import sys, os, json
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import utils.scrapper as scrapper
+
+
+def item(title: str, url: str) -> dict:
+  return {'diffusion': {'title': title}, 'sources': [{'url': url}]}
+
+
+def merge(feeds: dict) -> list:
+  scrapper.entries, scrapper.index, scrapper.feeds, scrapper.validators = [], {}, dict(feeds), {}
+  with scrapper._lock: return scrapper._merge_feeds()
+
+
+def test_merge_dedupes_and_sorts_newest_first():
+  new_entries = merge({
+    "feed1": [item("Journal 18/10/2026 22h00", "http://cdn/a_-_20261018_220000.mp3"), item("Journal 18/10/2026 20h00", "http://cdn/b_-_20261018_200000.mp3")],
+    "feed2": [item("Journal 18/10/2026 21h00", "http://cdn/c.mp3"), item("Duplicate 18/10/2026 22h00", "http://cdn/a_-_20261018_220000.mp3"), item("No date", "http://cdn/d.mp3")],
+  })
+  assert [entry.url for entry in scrapper.entries] == ["http://cdn/a_-_20261018_220000.mp3", "http://cdn/c.mp3", "http://cdn/b_-_20261018_200000.mp3", "http://cdn/d.mp3"]
+  assert [entry.number for entry in scrapper.entries] == [0, 1, 2, 3]
+  assert scrapper.entries[0].full_title == "Journal 18/10/2026 22h00"  # First feed wins a duplicate
+  assert len(new_entries) == 4
+  assert scrapper.entry_by_title("Journal 18/10/2026 21h00").url == "http://cdn/c.mp3"
+
+
+def test_merge_reports_only_new_entries():
+  merge({"feed1": [item("Journal 18/10/2026 20h00", "http://cdn/b_-_20261018_200000.mp3")]})
+  known = scrapper.entries[0]
+  scrapper.feeds["feed1"] = [item("Journal 18/10/2026 22h00", "http://cdn/a_-_20261018_220000.mp3")] + scrapper.feeds["feed1"]
+  with scrapper._lock: new_entries = scrapper._merge_feeds()
+  assert [entry.url for entry in new_entries] == ["http://cdn/a_-_20261018_220000.mp3"]
+  assert scrapper.entries[1] is known and known.number == 1
+
+
+def test_load_cached_reads_single_feed_caches(tmp_path):
+  cache_filename = str(tmp_path / "feed.json")
+  with open(cache_filename, "w") as file: json.dump({'validators': {'url': "http://feed", 'etag': '"x"'}, 'items': [item("Journal 18/10/2026 20h00", "http://cdn/b.mp3")]}, file)
+  merge({})
+  assert scrapper.load_cached(["http://feed"], cache_filename)
+  assert [entry.url for entry in scrapper.entries] == ["http://cdn/b.mp3"]
+  assert scrapper.validators == {"http://feed": {'etag': '"x"'}}
+  assert not scrapper.load_cached(["http://other"], cache_filename)
@@ -0,0 +1,327 @@
+import io, os, sys, time
+from typing import Protocol, Union
+from utils.mp3index import FrameIndex
+
+
+STATUS_STOPPED = "stopped"
+STATUS_PLAYING = "playing"
+STATUS_PAUSED = "paused"
+
+
+class BackendError(Exception):
+  pass
+
+
+class AudioBackend(Protocol):
+  """What MP3Handler expects from an audio output. Positions and lengths are in seconds, volume in 0-100."""
+  in_memory: bool
+  calls: int
+
+  def open(self, source: Union[str, bytes]) -> None: ...
+  def close(self) -> None: ...
+  def play(self) -> None: ...
+  def pause(self) -> None: ...
+  def resume(self) -> None: ...
+  def stop(self) -> None: ...
+  def seek(self, position: float) -> None: ...
+  def position(self) -> float: ...
+  def length(self) -> float: ...
+  def status(self) -> str: ...
+  def get_volume(self) -> int: ...
+  def set_volume(self, volume: int) -> None: ...
+
+
+def _duration(source: Union[str, bytes], head_size=65536) -> float:
+  """Duration of an MP3 from its first frames (Xing/Info header, else constant bitrate)."""
+  if isinstance(source, (bytes, bytearray)): head, size = bytes(source[:head_size]), len(source)
+  else:
+    with open(source, "rb") as file: head, size = file.read(head_size), os.path.getsize(source)
+  index = FrameIndex(size)
+  index.feed(head)
+  return index.duration
+
+
+class MCIBackend():
+  """Windows Media Control Interface, playing a file on disk."""
+  in_memory = False
+
+
+  def __init__(self) -> None:
+    from ctypes import c_buffer, windll
+    self._c_buffer = c_buffer
+    self._winmm = windll.winmm
+    self._alias = "A{}".format(id(self))
+    self.calls = 0
+
+
+  def open(self, source: str) -> None:
+    self._send(r'open "{}" type mpegvideo alias {}'.format(source, self._alias))
+    self._send(f"set {self._alias} time format milliseconds")
+
+
+  def close(self) -> None:
+    self._send(f"close {self._alias}")
+
+
+  def play(self) -> None:
+    self._send(f"play {self._alias}")
+
+
+  def pause(self) -> None:
+    self._send(f"pause {self._alias}")
+
+
+  def resume(self) -> None:
+    self._send(f"resume {self._alias}")
+
+
+  def stop(self) -> None:
+    self._send(f"stop {self._alias}")
+    self._send(f"seek {self._alias} to start")
+
+
+  def seek(self, position: float) -> None:
+    self._send(f"play {self._alias} from {int(position * 1000)}")
+
+
+  def position(self) -> float:
+    return int(self._send(f"status {self._alias} position", True)) / 1000
+
+
+  def length(self) -> float:
+    return int(self._send(f"status {self._alias} length", True)) / 1000
+
+
+  def status(self) -> str:
+    return self._send(f"status {self._alias} mode", True)
+
+
+  def get_volume(self) -> int:
+    return int(self._send(f"status {self._alias} volume", True)) // 10
+
+
+  def set_volume(self, volume: int) -> None:
+    self._send(f"setaudio {self._alias} volume to {int(volume) * 10}")
+
+
+  def _send(self, command: str, buffer=False) -> str:
+    self.calls += 1
+    if buffer:
+      buffer = self._c_buffer(255)
+      ret = self._winmm.mciSendStringW(command, buffer, 254, 0)
+    else: ret = self._winmm.mciSendStringW(command, 0, 0, 0)
+    if ret != 0:
+      error_str = self._c_buffer(255)
+      self._winmm.mciGetErrorStringA(ret, error_str, 254)
+      raise BackendError(str(error_str.value, encoding="windows_1252"))
+    if buffer: return str(buffer.raw.replace(b'\x00', b''), encoding="windows_1252")
+
+
+class MemoryBackend():
+  """Plays an in-memory MP3 through pygame (optional dependency, works on Linux)."""
+  in_memory = True
+
+
+  def __init__(self) -> None:
+    import pygame
+    try: pygame.mixer.init()
+    except pygame.error as e: raise BackendError(f"No audio device: {e}")
+    self._music = pygame.mixer.music
+    self._error = pygame.error
+    self._length = 0.0
+    self._offset = 0.0
+    self._played_before = 0  # get_pos() when <_offset> was taken, unpause() does not reset it
+    self._status = STATUS_STOPPED
+    self.calls = 0
+
+
+  def open(self, source: Union[str, bytes]) -> None:
+    self.calls += 1
+    self._length = _duration(source)
+    try:
+      if isinstance(source, (bytes, bytearray)): self._music.load(io.BytesIO(source), "mp3")
+      else: self._music.load(source)
+    except self._error as e: raise BackendError(str(e))
+    self._offset = 0.0
+    self._status = STATUS_STOPPED
+
+
+  def close(self) -> None:
+    self.calls += 1
+    self._music.unload()
+
+
+  def play(self) -> None:
+    self.seek(self._offset if self._status == STATUS_PAUSED else 0.0)
+
+
+  def pause(self) -> None:
+    self.calls += 1
+    self._offset = self.position()
+    self._played_before = max(self._music.get_pos(), 0)
+    self._music.pause()
+    self._status = STATUS_PAUSED
+
+
+  def resume(self) -> None:
+    self.calls += 1
+    self._music.unpause()
+    self._status = STATUS_PLAYING
+
+
+  def stop(self) -> None:
+    self.calls += 1
+    self._music.stop()
+    self._offset = 0.0
+    self._status = STATUS_STOPPED
+
+
+  def seek(self, position: float) -> None:
+    self.calls += 1
+    self._music.play(start=position)
+    self._offset = position
+    self._played_before = 0
+    self._status = STATUS_PLAYING
+
+
+  def position(self) -> float:
+    self.calls += 1
+    if self._status != STATUS_PLAYING: return self._offset
+    elapsed = self._music.get_pos() - self._played_before
+    return min(self._offset + max(elapsed, 0) / 1000, self._length or float("inf"))
+
+
+  def length(self) -> float:
+    return self._length
+
+
+  def status(self) -> str:
+    self.calls += 1
+    if self._status == STATUS_PLAYING and not self._music.get_busy(): self._status = STATUS_STOPPED
+    return self._status
+
+
+  def get_volume(self) -> int:
+    self.calls += 1
+    return round(self._music.get_volume() * 100)
+
+
+  def set_volume(self, volume: int) -> None:
+    self.calls += 1
+    self._music.set_volume(int(volume) / 100)
+
+
+class SimulatedBackend():
+  """Deterministic stand-in that only keeps time, for headless benchmarks.
+
+  Args:
+      latency (float, optional): Seconds every call blocks for, to mimic a slow backend. Defaults to 0.0.
+      clock (callable, optional): Time source in seconds. Defaults to time.monotonic.
+  """
+  in_memory = True
+
+
+  def __init__(self, latency=0.0, clock=time.monotonic) -> None:
+    self.latency = latency
+    self.clock = clock
+    self.calls = 0
+    self._length = 0.0
+    self._offset = 0.0
+    self._started = 0.0
+    self._status = STATUS_STOPPED
+    self._volume = 100
+    self._opened = False
+
+
+  def open(self, source: Union[str, bytes]) -> None:
+    self._call(opening=True)
+    self._length = _duration(source)
+    if not self._length: raise BackendError("No MPEG audio frame found")
+    self._offset = 0.0
+    self._status = STATUS_STOPPED
+    self._opened = True
+
+
+  def close(self) -> None:
+    self._call()
+    self._opened = False
+
+
+  def play(self) -> None:
+    self.seek(self._offset if self._status == STATUS_PAUSED else 0.0)
+
+
+  def pause(self) -> None:
+    self._offset = self.position()
+    self._status = STATUS_PAUSED
+
+
+  def resume(self) -> None:
+    self._call()
+    self._started = self.clock()
+    self._status = STATUS_PLAYING
+
+
+  def stop(self) -> None:
+    self._call()
+    self._offset = 0.0
+    self._status = STATUS_STOPPED
+
+
+  def seek(self, position: float) -> None:
+    self._call()
+    self._offset = min(max(position, 0.0), self._length)
+    self._started = self.clock()
+    self._status = STATUS_PLAYING
+
+
+  def position(self) -> float:
+    self._call()
+    if self._status != STATUS_PLAYING: return self._offset
+    position = self._offset + self.clock() - self._started
+    if position >= self._length:
+      self._offset, self._status = self._length, STATUS_STOPPED
+      return self._length
+    return position
+
+
+  def length(self) -> float:
+    self._call()
+    return self._length
+
+
+  def status(self) -> str:
+    self.position()
+    return self._status
+
+
+  def get_volume(self) -> int:
+    self._call()
+    return self._volume
+
+
+  def set_volume(self, volume: int) -> None:
+    self._call()
+    self._volume = int(volume)
+
+
+  def _call(self, opening=False) -> None:
+    self.calls += 1
+    if self.latency: time.sleep(self.latency)
+    if not opening and not self._opened: raise BackendError("Device not open")
+
+
+def create_backend(name="auto") -> AudioBackend:
+  """Instantiates an audio backend.
+
+  Args:
+      name (str, optional): "mci", "memory", "simulated" or "auto" (MCI on Windows, else pygame if installed with an audio device, else simulated). Defaults to "auto".
+
+  Returns:
+      AudioBackend: A new backend instance.
+  """
+  if name == "auto":
+    if sys.platform == "win32": return MCIBackend()
+    try: return MemoryBackend()
+    except (ImportError, BackendError): return SimulatedBackend()  # Silent: callers should tell the user
+  return {"mci": MCIBackend, "memory": MemoryBackend, "simulated": SimulatedBackend}[name]()
@@ -0,0 +1,143 @@
+import os, json, time, shutil, hashlib, threading
+import urllib.request as request
+from http.client import HTTPException
+
+
+class EpisodeCache():
+  INDEX_FILENAME = "index.json"
+
+
+  def __init__(self, cache_dir="cache", max_bytes=524288000, max_age=604800) -> None:
+    self.cache_dir = cache_dir
+    self.max_bytes = max_bytes
+    self.max_age = max_age
+    self._lock = threading.Lock()
+    os.makedirs(self.cache_dir, exist_ok=True)
+    self._index = self._load_index()
+
+
+  def key(self, url: str) -> str:
+    return hashlib.sha256(url.encode("utf8")).hexdigest()
+
+
+  def path(self, url: str) -> str:
+    return os.path.join(self.cache_dir, f"{self.key(url)}.mp3")
+
+
+  def temp_path(self, url: str) -> str:
+    return os.path.join(self.cache_dir, f"{self.key(url)}.{threading.get_ident()}.tmp")
+
+
+  def lookup(self, url: str, revalidate=True) -> str:
+    """Returns the cached file of an URL, or None on a miss (expired episodes are removed).
+
+    Args:
+        url (str): Source URL of the episode.
+        revalidate (bool, optional): Checks ETag/Content-Length against the server first. Defaults to True.
+
+    Returns:
+        str: Path of the cached file, or None.
+    """
+    with self._lock:
+      item = self._index.get(self.key(url))
+    if item is None or not os.path.exists(self.path(url)): return None
+    if time.time() - item['created'] > self.max_age or (revalidate and not self._revalidate(url, item)):
+      self.remove(url)
+      return None
+    with self._lock:
+      item['last_used'] = time.time()
+      self._save_index()
+    return self.path(url)
+
+
+  def store(self, url: str, filename: str, etag: str = None, move=False) -> str:
+    """Copies a fully downloaded file into the cache, then evicts if over budget.
+
+    Args:
+        url (str): Source URL of the episode.
+        filename (str): Downloaded file to copy.
+        etag (str, optional): ETag sent by the server. Defaults to None.
+        move (bool, optional): Moves <filename> instead of copying it (must be on the same drive). Defaults to False.
+
+    Returns:
+        str: Path of the cached file.
+    """
+    if move: os.replace(filename, self.path(url))
+    else:
+      temp_path = self.temp_path(url)
+      shutil.copyfile(filename, temp_path)
+      os.replace(temp_path, self.path(url))
+    return self._add(url, etag)
+
+
+  def store_data(self, url: str, data: bytes, etag: str = None) -> str:
+    """Writes an in-memory download into the cache, then evicts if over budget.
+
+    Args:
+        url (str): Source URL of the episode.
+        data (bytes): Episode content.
+        etag (str, optional): ETag sent by the server. Defaults to None.
+
+    Returns:
+        str: Path of the cached file.
+    """
+    temp_path = self.temp_path(url)
+    with open(temp_path, "wb") as file: file.write(data)
+    os.replace(temp_path, self.path(url))
+    return self._add(url, etag)
+
+
+  def _add(self, url: str, etag: str) -> str:
+    with self._lock:
+      now = time.time()
+      self._index[self.key(url)] = {'url': url, 'etag': etag, 'length': os.path.getsize(self.path(url)), 'created': now, 'last_used': now}
+      self._evict()
+      self._save_index()
+    return self.path(url)
+
+
+  def remove(self, url: str) -> None:
+    with self._lock:
+      self._remove_key(self.key(url))
+      self._save_index()
+
+
+  def _revalidate(self, url: str, item: dict) -> bool:
+    try:
+      with request.urlopen(request.Request(url, method="HEAD"), timeout=5) as response:
+        etag = response.headers.get("ETag")
+        length = response.headers.get("Content-Length")
+    except (OSError, HTTPException): return True  # Offline or garbled answer: trust what we have
+    if etag and item['etag']: return etag == item['etag']
+    if length is not None: return int(length) == item['length']
+    return True
+
+
+  def _evict(self) -> None:
+    now = time.time()
+    for key in [key for key, item in self._index.items() if now - item['created'] > self.max_age]:
+      self._remove_key(key)
+    total = sum(item['length'] for item in self._index.values())
+    for key in sorted(self._index, key=lambda key: self._index[key]['last_used']):
+      if total <= self.max_bytes: break
+      total -= self._index[key]['length']
+      self._remove_key(key)
+
+
+  def _remove_key(self, key: str) -> None:
+    self._index.pop(key, None)
+    path = os.path.join(self.cache_dir, f"{key}.mp3")
+    try: os.remove(path)
+    except OSError: pass
+
+
+  def _load_index(self) -> dict:
+    try:
+      with open(os.path.join(self.cache_dir, self.INDEX_FILENAME), "r") as file: return json.load(fp=file)
+    except (OSError, ValueError): return {}
+
+
+  def _save_index(self) -> None:
+    index_path = os.path.join(self.cache_dir, self.INDEX_FILENAME)
+    with open(f"{index_path}.tmp", "w") as file: json.dump(obj=self._index, fp=file)
+    os.replace(f"{index_path}.tmp", index_path)
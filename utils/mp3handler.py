@@ -1,112 +1,406 @@
-import os
-from ctypes import c_buffer, windll
+import os, mmap, time, tempfile, itertools, threading, contextlib
 import urllib.request as request
+from http.client import HTTPException
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.cache import EpisodeCache
+from utils.backends import AudioBackend, BackendError, create_backend
+from utils.mp3index import FrameIndex
+import utils.tracing as tracing
+
+
+class PlayerState(NamedTuple):
+  status: str
+  position: float
+  length: float
+  duration: float
+
+
+_temp_numbers = itertools.count()
 
 
 class MP3Handler():
   STATUS_STOPPED = "stopped"
   STATUS_PLAYING = "playing"
   STATUS_PAUSED = "paused"
+  CHUNK_SIZE = 16384
+  PROGRESS_INTERVAL = 0.25
 
 
-  def __init__(self, mp3_url: str, mp3_filename="rfitemp.mp3") -> None:
+  def __init__(self, mp3_url: str, mp3_filename: str = None, buffer_threshold=262144, cache: EpisodeCache = None, on_progress=None, backend: AudioBackend = None) -> None:
     self.mp3_url = mp3_url
-    self.mp3_filename = mp3_filename
-    self._alias = "A{}".format(id(self))
+    self.mp3_filename = mp3_filename or os.path.join(tempfile.gettempdir(), f"rfitemp-{os.getpid()}-{next(_temp_numbers)}.mp3")  # One per handler and process
+    self.cache = cache
+    self.on_progress = on_progress
+    self.etag = None
+    self.loaded = False
+    self.buffer_threshold = buffer_threshold
+    self.downloaded_bytes = 0
+    self.total_bytes = 0
+    self.underruns = 0
+    self.backend = backend or create_backend()
+    self.buffer = bytearray()
+    self.index = FrameIndex()
+    self.segments = []
+    self._length = None
+    self._buffered = threading.Event()
+    self._cancelled = threading.Event()
+    self._download_thread: threading.Thread = None
+    self._download_error: Exception = None
+    self._download_started = 0.0
+    self._download_ended = 0.0
+    self._last_progress = 0.0
+    self._progress_lock = threading.Lock()
+    self._underrun_position = None
+    self._underrun_bytes = 0
+    self._stopped = True
+    self._opened_complete = False
+    self._closed = False
+    self._close_lock = threading.Lock()
+    self._download_finished = False
+    self._cached = False
+    self._played = False
 
 
   def __del__(self):
-    self._mci_send_string(f"close {self._alias}")
-    if os.path.exists(self.mp3_filename): os.remove(self.mp3_filename)
+    self.close()
+
+
+  def close(self) -> None:
+    """Stops playback and cancels the download without waiting for it (ie. from the GUI thread).
 
+    A download thread still running removes the temp file itself once it ends.
+    """
+    if self._closed: return
+    self._cancelled.set()
+    try:
+      if self.loaded: self.backend.close()
+    except BackendError: pass
+    with self._close_lock:
+      self._closed = True
+      downloading = self._download_thread is not None and not self._download_finished
+    if not downloading: self._remove_temp_file()
+
+
+  def _remove_temp_file(self) -> None:
+    if self._cached or not os.path.exists(self.mp3_filename): return
+    try: os.remove(self.mp3_filename)
+    except OSError: pass
 
-  def download_MP3(self) -> None:
-    self.mp3_file = request.urlretrieve(url=self.mp3_url, filename=self.mp3_filename)[0]
+
+  def download_MP3(self, segments=4) -> None:
+    """Downloads the whole file, over <segments> parallel range requests when the server accepts them."""
+    self._download_started = time.monotonic()
+    if self._use_cache(): return
+    try:
+      with request.urlopen(request.Request(self.mp3_url, method="HEAD"), timeout=30) as response:
+        total = int(response.headers.get("Content-Length", 0))
+        ranges = response.headers.get("Accept-Ranges") == "bytes"
+        self.etag = response.headers.get("ETag")
+    except (OSError, HTTPException): total, ranges = 0, False  # HEAD refused (ie. 403/405 on some CDNs): single stream
+    if segments < 2 or not total or not ranges:
+      self._download_chunks()
+      if self._download_error: raise self._download_error
+      return
+
+    self.total_bytes = self.index.total_bytes = total
+    segment_size = -(-total // segments)
+    self.segments = [{'start': start, 'end': min(start + segment_size, total) - 1, 'bytes': 0, 'seconds': 0.0} for start in range(0, total, segment_size)]
+    with tracing.span("download", url=self.mp3_url, segments=len(self.segments)) as record, self._open_segmented_output(total) as view:
+      aborted = threading.Event()  # Set when a segment fails so that the others stop instead of completing
+      with ThreadPoolExecutor(max_workers=len(self.segments)) as executor:
+        futures = [executor.submit(self._download_segment, view, segment, aborted) for segment in self.segments]
+        try:
+          for future in as_completed(futures): future.result()
+        except BaseException:
+          aborted.set()
+          raise
+      record['bytes'] = received = sum(segment['bytes'] for segment in self.segments)
+      if received < total:
+        self._download_ended = time.monotonic()
+        if self._cancelled.is_set(): return
+        raise OSError(f"Segments ended at {received} of {total} bytes")
+      for start in range(0, total, self.CHUNK_SIZE): self.index.feed(view[start:start + self.CHUNK_SIZE])
+    self._download_ended = time.monotonic()
+    self._buffered.set()
+    if self.cache:
+      if self.backend.in_memory: self.cache.store_data(self.mp3_url, self.buffer, self.etag)
+      else: self.cache.store(self.mp3_url, self.mp3_filename, self.etag)
+    self._notify_progress(force=True)
+
+
+  @contextlib.contextmanager
+  def _open_segmented_output(self, size: int):
+    """Preallocates the whole file (or buffer) so that segments are read straight into place."""
+    if self.backend.in_memory:
+      self.buffer = bytearray(size)
+      with memoryview(self.buffer) as view: yield view
+      return
+    with open(self.mp3_filename, "w+b") as file:
+      file.truncate(size)
+      with mmap.mmap(file.fileno(), size) as mapped_file, memoryview(mapped_file) as view: yield view
+
+
+  def _download_segment(self, view: memoryview, segment: dict, aborted: threading.Event) -> None:
+    started, position, end = time.monotonic(), segment['start'], segment['end']
+    headers = {"Range": f"bytes={position}-{end}"}
+    if self.etag: headers["If-Range"] = self.etag
+    with tracing.span("download.segment", start=position, end=end) as record, request.urlopen(request.Request(self.mp3_url, headers=headers), timeout=30) as response:
+      if response.status != 206: raise OSError(f"Range request answered with HTTP {response.status}")
+      while position <= end and not self._cancelled.is_set() and not aborted.is_set():
+        read = response.readinto(view[position:min(position + self.CHUNK_SIZE, end + 1)])
+        if not read: break
+        position += read
+        with self._progress_lock: self.downloaded_bytes += read
+        segment['bytes'] += read
+        segment['seconds'] = time.monotonic() - started
+        self._notify_progress()
+      record['bytes'] = segment['bytes']
+    if position <= end and not self._cancelled.is_set() and not aborted.is_set(): raise OSError(f"Segment {segment['start']}-{end} ended at {position}")
+
+
+  def stream_MP3(self) -> None:
+    """Starts downloading in the background and returns as soon as <buffer_threshold> bytes are on disk."""
+    self.start_stream()
+    self._buffered.wait()
+    if self._download_error: raise self._download_error
+
+
+  def start_stream(self) -> None:
+    """Starts downloading in the background and returns immediately.
+
+    <on_progress> is called from the download thread with this handler as the transfer goes,
+    once <Buffered> becomes True and when the download ends.
+    """
+    self._download_started = time.monotonic()
+    self._download_thread = threading.Thread(target=self._download_chunks, daemon=True)
+    self._download_thread.start()
+
+
+  def _download_chunks(self) -> None:
+    with tracing.span("download", url=self.mp3_url, segments=1) as record:
+      self._download_stream()
+      record['bytes'], record['cached'] = self.downloaded_bytes, self._cached
+      if self._download_error: record['error'] = repr(self._download_error)
+    with self._close_lock:
+      self._download_finished = True
+      closed = self._closed
+    if closed: self._remove_temp_file()
+
+
+  def _download_stream(self) -> None:
+    try:
+      if self._use_cache(): return
+      with request.urlopen(self.mp3_url, timeout=30) as response, self._open_output() as file:
+        self.total_bytes = int(response.headers.get("Content-Length", 0))
+        self.etag = response.headers.get("ETag")
+        self.index.total_bytes = self.total_bytes
+        while not self._cancelled.is_set():
+          chunk = response.read(self.CHUNK_SIZE)
+          if not chunk: break
+          if file:
+            file.write(chunk)
+            file.flush()
+          else: self.buffer += chunk
+          self.index.feed(chunk)
+          self.downloaded_bytes += len(chunk)
+          if not self._buffered.is_set() and self.downloaded_bytes >= self.buffer_threshold:
+            self._buffered.set()
+            tracing.event("download.buffered", time.monotonic() - self._download_started, url=self.mp3_url, bytes=self.downloaded_bytes)
+            self._notify_progress(force=True)
+          else: self._notify_progress()
+      if self._cancelled.is_set(): return
+      if self.total_bytes and self.downloaded_bytes < self.total_bytes: raise OSError(f"Download ended at {self.downloaded_bytes} of {self.total_bytes} bytes")
+      if self.cache and self.downloaded_bytes == (self.total_bytes or self.downloaded_bytes):
+        if self.backend.in_memory: self.cache.store_data(self.mp3_url, self.buffer, self.etag)
+        else: self.cache.store(self.mp3_url, self.mp3_filename, self.etag)
+    except Exception as e: self._download_error = e
+    finally:
+      self._download_ended = time.monotonic()
+      self._buffered.set()
+      self._notify_progress(force=True)
+
+
+  def _open_output(self):
+    if self.backend.in_memory: return contextlib.nullcontext()
+    return open(self.mp3_filename, "wb")
+
+
+  def _notify_progress(self, force=False) -> None:
+    if not self.on_progress or self._cancelled.is_set(): return
+    with self._progress_lock:
+      now = time.monotonic()
+      if not force and now - self._last_progress < self.PROGRESS_INTERVAL: return
+      self._last_progress = now
+    self.on_progress(self)
+
+
+  def _use_cache(self) -> bool:
+    if not self.cache: return False
+    cached_filename = self.cache.lookup(self.mp3_url)
+    if cached_filename is None: return False
+    self.mp3_filename = cached_filename
+    self.downloaded_bytes = self.total_bytes = os.path.getsize(cached_filename)
+    self._cached = True
+    return True
+
+
+  def snapshot(self) -> PlayerState:
+    """Queries status and position once, length being cached after load."""
+    return PlayerState(self.Status, self.Position, self.Length, self.Duration)
+
+
+  def update_buffer(self, state: PlayerState = None) -> None:
+    """Detects playback catching up with the download and resumes once the buffer is refilled.
+
+    Must be called periodically (ie. on each UI tick) while streaming.
+    """
+    if self._underrun_position is not None:
+      if self.Downloading and self.downloaded_bytes - self._underrun_bytes < self.buffer_threshold: return
+      position = self._underrun_position
+      self._underrun_position = None
+      self.backend.close()
+      self.load_MP3()
+      self.Position = position
+    elif (self.Downloading or not self._opened_complete) and not self._stopped:
+      status, position, length, _ = state or self.snapshot()
+      if status == self.STATUS_STOPPED or (length and position >= length):
+        self.underruns += 1
+        self._underrun_position = position
+        self._underrun_bytes = self.downloaded_bytes
 
 
   def load_MP3(self) -> None:
-    self._mci_send_string(r'open "{}" type mpegvideo alias {}'.format(self.mp3_filename, self._alias))
-    self._mci_send_string(f"set {self._alias} time format milliseconds")
+    self._length = None
+    self._opened_complete = not self.Downloading
+    with tracing.span("load", url=self.mp3_url, bytes=self.downloaded_bytes, complete=self._opened_complete):
+      self.backend.open(bytes(self.buffer) if self.backend.in_memory and not self._cached else self.mp3_filename)
+    self.loaded = True
 
 
   def play(self) -> None:
-    self._mci_send_string(f"play {self._alias}")
+    self._stopped = False
+    self.backend.play()
+    if not self._played:
+      self._played = True
+      tracing.event("first play", time.monotonic() - self._download_started, url=self.mp3_url, bytes=self.downloaded_bytes, cached=self._cached)
 
 
   def pause(self) -> None:
-    self._mci_send_string(f"pause {self._alias}")
+    self.backend.pause()
 
 
   def resume(self) -> None:
-    self._mci_send_string(f"resume {self._alias}")
+    self.backend.resume()
 
 
   def stop(self) -> None:
-    self._mci_send_string(f"stop {self._alias}")
-    self._mci_send_string(f"seek {self._alias} to start")
+    self._stopped = True
+    self._underrun_position = None
+    self.backend.stop()
+
+
+  @property
+  def backend_calls(self) -> int:
+    return self.backend.calls
+
+
+  @property
+  def Downloading(self) -> bool:
+    return self._download_thread is not None and not self._download_ended
+
+
+  @property
+  def Buffered(self) -> bool:
+    return self._buffered.is_set()
+
+
+  @property
+  def Error(self) -> Exception:
+    return self._download_error
+
+
+  @property
+  def Throughput(self) -> float:
+    elapsed = (self._download_ended or time.monotonic()) - self._download_started
+    if self._cached or not elapsed: return 0.0
+    return self.downloaded_bytes / elapsed
+
+
+  @property
+  def ETA(self) -> float:
+    throughput = self.Throughput
+    if not self.total_bytes or not throughput: return 0.0
+    return (self.total_bytes - self.downloaded_bytes) / throughput
+
+
+  @property
+  def SegmentThroughputs(self) -> list[float]:
+    """Bytes per second of each range of the last segmented download_MP3()."""
+    return [segment['bytes'] / segment['seconds'] if segment['seconds'] else 0.0 for segment in self.segments]
 
 
-  def _mci_send_string(self, command, buffer=False):
-    if buffer:
-      buffer = c_buffer(255)
-      ret = windll.winmm.mciSendStringW(command, buffer, 254, 0)
-      if ret != 0: raise MP3HandlerError(ret)
-      return buffer.raw
-    if not buffer:
-      ret = windll.winmm.mciSendStringW(command, 0, 0, 0)
-      if ret != 0: raise MP3HandlerError(ret)
+  @property
+  def BufferLevel(self) -> int:
+    if not self.total_bytes: return 100 if not self.Downloading else 0
+    return int(self.downloaded_bytes * 100 / self.total_bytes)
+
+
+  @property
+  def Underrun(self) -> bool:
+    return self._underrun_position is not None
 
 
   @property
   def Length(self):
-    try:
-      length = self._mci_send_string(f"status {self._alias} length", True)
-      length = int(length.replace(b'\x00', b'')) / 1000
-    except: length = 0.0
+    if self._length: return self._length
+    try: length = self.backend.length()
+    except BackendError: length = 0.0
+    if self.loaded: self._length = length
     return length
 
 
+  @property
+  def Duration(self) -> float:
+    """Full duration, known from the frame index long before the download ends."""
+    return self.index.duration or self.Length
+
+
+  def seek_range(self, position: float) -> tuple[int, int]:
+    """Byte range still missing to play from <position>, None if already downloaded (see FrameIndex.needed_range)."""
+    return self.index.needed_range(position, self.downloaded_bytes)
+
+
   @property
   def Position(self):
-    try:
-      position = self._mci_send_string(f"status {self._alias} position", True)
-      position = int(position.replace(b'\x00', b'')) / 1000
-    except: position = 0.0
-    return position  
+    try: position = self.backend.position()
+    except BackendError: position = 0.0
+    return position
 
 
   @Position.setter
   def Position(self, new_value: float):
     if new_value < 0: new_value = 0
     if new_value > self.Length: new_value = self.Length
-    self._mci_send_string(f"play {self._alias} from {int(new_value * 1000)}")
+    self.backend.seek(new_value)
 
 
   @property
   def Status(self):
-    try:
-      status = self._mci_send_string(f"status {self._alias} mode", True)
-      status = str(status.replace(b'\x00', b'')).removeprefix("b'").removesuffix("'")
-    except: status = "stopped"
+    try: status = self.backend.status()
+    except BackendError: status = "stopped"
     return status
 
 
   @property
   def Volume(self):
-    try:
-      volume = self._mci_send_string(f"status {self._alias} volume", True)
-      volume = int(volume.replace(b'\x00', b'')) / 10
-    except: volume = 100.0
+    try: volume = self.backend.get_volume()
+    except BackendError: volume = 100
     return int(volume)
 
   @Volume.setter
   def Volume(self, new_value: float):
-    self._mci_send_string(f"setaudio {self._alias} volume to {int(new_value)*10}")
+    self.backend.set_volume(new_value)
 
 
-class MP3HandlerError(Exception):
-  def __init__(self, error_code: int) -> None:
-    error_str = c_buffer(255)
-    windll.winmm.mciGetErrorStringA(error_code, error_str, 254)
-    error_str = str(error_str.value, encoding="windows_1252")
-    super().__init__(error_str)
\ No newline at end of file
+MP3HandlerError = BackendError
\ No newline at end of file
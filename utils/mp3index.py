@@ -0,0 +1,177 @@
+from typing import NamedTuple
+
+
+_BITRATES = {
+  3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),    # MPEG 1
+  2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),        # MPEG 2
+  0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),        # MPEG 2.5
+}
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+class FrameHeader(NamedTuple):
+  bitrate: int
+  sample_rate: int
+  samples: int
+  length: int
+  side_info: int
+
+
+def parse_header(data: bytes, offset=0) -> FrameHeader:
+  """Decodes the MPEG layer III frame header at <offset>.
+
+  Args:
+      data (bytes): Buffer holding at least 4 bytes from <offset>.
+      offset (int, optional): Position of the header. Defaults to 0.
+
+  Returns:
+      FrameHeader: Decoded header, or None if these bytes are not a valid header.
+  """
+  if data[offset] != 0xff or data[offset + 1] & 0xe0 != 0xe0: return None
+  version = (data[offset + 1] >> 3) & 0x03
+  layer = (data[offset + 1] >> 1) & 0x03
+  bitrate_index = data[offset + 2] >> 4
+  sample_rate_index = (data[offset + 2] >> 2) & 0x03
+  if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3: return None
+  bitrate = _BITRATES[version][bitrate_index] * 1000
+  sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+  padding = (data[offset + 2] >> 1) & 0x01
+  mono = data[offset + 3] >> 6 == 3
+  if version == 3: return FrameHeader(bitrate, sample_rate, 1152, 144 * bitrate // sample_rate + padding, 17 if mono else 32)
+  return FrameHeader(bitrate, sample_rate, 576, 72 * bitrate // sample_rate + padding, 9 if mono else 17)
+
+
+class FrameIndex():
+  RESOLUTION = 1.0
+
+
+  def __init__(self, total_bytes=0) -> None:
+    """Time to byte offset index of an MP3, built incrementally from the bytes as they arrive.
+
+    Args:
+        total_bytes (int, optional): Size of the whole file if known (ie. Content-Length). Defaults to 0.
+    """
+    self.total_bytes = total_bytes
+    self.audio_start = None
+    self.bitrate = 0
+    self.sample_rate = 0
+    self.samples_per_frame = 0
+    self.samples = 0
+    self.frames = 0
+    self.xing_frames = 0
+    self.xing_bytes = 0
+    self.toc = None
+    self._offsets = []
+    self._buffer = bytearray()
+    self._buffer_offset = 0
+    self._skip = 0
+
+
+  def feed(self, data: bytes) -> None:
+    """Scans the next bytes of the file."""
+    if self._skip >= len(data):
+      self._skip -= len(data)
+      self._buffer_offset += len(data)
+      return
+    self._buffer += memoryview(data)[self._skip:]
+    self._buffer_offset += self._skip
+    self._skip = 0
+    buffer, position = self._buffer, 0
+    while position + 4 <= len(buffer):
+      if self.audio_start is None and buffer[position:position + 3] == b"ID3":
+        if position + 10 > len(buffer): break
+        position += 10 + ((buffer[position + 6] & 0x7f) << 21 | (buffer[position + 7] & 0x7f) << 14 | (buffer[position + 8] & 0x7f) << 7 | (buffer[position + 9] & 0x7f))
+        continue
+      header = parse_header(buffer, position)
+      if header is None:
+        next_sync = buffer.find(b"\xff", position + 1)
+        position = next_sync if next_sync != -1 else len(buffer)
+        continue
+      if self.audio_start is None:
+        if position + 4 + header.side_info + 120 > len(buffer) and not self.complete: break  # Wait for a possible Xing/Info tag
+        self._start(position, header)
+      else: self._add_frame(self._buffer_offset + position, header)
+      position += header.length
+    if position > len(buffer):
+      self._skip = position - len(buffer)
+      position = len(buffer)
+    del buffer[:position]
+    self._buffer_offset += position
+
+
+  @property
+  def complete(self) -> bool:
+    return bool(self.total_bytes) and self._buffer_offset + self._skip + len(self._buffer) >= self.total_bytes
+
+
+  def _start(self, position: int, header: FrameHeader) -> None:
+    self.audio_start = self._buffer_offset + position
+    self.bitrate, self.sample_rate, self.samples_per_frame = header.bitrate, header.sample_rate, header.samples
+    tag_offset = position + 4 + header.side_info
+    tag = bytes(self._buffer[tag_offset:tag_offset + 120])
+    if tag[:4] in (b"Xing", b"Info"):
+      flags, field = int.from_bytes(tag[4:8], "big"), 8
+      if flags & 0x1: self.xing_frames, field = int.from_bytes(tag[field:field + 4], "big"), field + 4
+      if flags & 0x2: self.xing_bytes, field = int.from_bytes(tag[field:field + 4], "big"), field + 4
+      if flags & 0x4 and len(tag) >= field + 100: self.toc = tag[field:field + 100]
+      return  # The Xing/Info frame carries no audio
+    self._add_frame(self.audio_start, header)
+
+
+  def _add_frame(self, offset: int, header: FrameHeader) -> None:
+    while self.samples >= len(self._offsets) * self.RESOLUTION * header.sample_rate: self._offsets.append(offset)
+    self.samples += header.samples
+    self.frames += 1
+
+
+  @property
+  def scanned_duration(self) -> float:
+    """Seconds of audio fully indexed so far."""
+    return self.samples / self.sample_rate if self.sample_rate else 0.0
+
+
+  @property
+  def duration(self) -> float:
+    """Exact duration from the Xing/Info header or a complete scan, else a constant bitrate estimate (0.0 if unknown)."""
+    if self.xing_frames: return self.xing_frames * self.samples_per_frame / self.sample_rate
+    if self.complete: return self.scanned_duration
+    if self.total_bytes and self.bitrate: return (self.total_bytes - self.audio_start) * 8 / self.bitrate
+    return 0.0
+
+
+  def offset_for(self, seconds: float) -> int:
+    """Byte offset of the frame playing at <seconds>, exact if already scanned, estimated otherwise.
+
+    Args:
+        seconds (float): Position in the audio.
+
+    Returns:
+        int: Offset in the file, None while no frame was found.
+    """
+    if self.audio_start is None: return None
+    seconds = max(seconds, 0.0)
+    index = int(seconds / self.RESOLUTION)
+    if index < len(self._offsets): return self._offsets[index]
+    duration = self.duration
+    if self.toc and self.xing_bytes and duration:
+      percent = min(seconds * 100 / duration, 99.999)
+      low = self.toc[int(percent)]
+      high = self.toc[int(percent) + 1] if int(percent) < 99 else 256
+      offset = self.audio_start + (low + (high - low) * (percent - int(percent))) * self.xing_bytes / 256
+    else: offset = self.audio_start + seconds * self.bitrate / 8
+    return min(int(offset), self.total_bytes - 1) if self.total_bytes else int(offset)
+
+
+  def needed_range(self, seconds: float, downloaded_bytes: int) -> tuple[int, int]:
+    """Tells which bytes to request (ie. with an HTTP Range header) to play from <seconds>.
+
+    Args:
+        seconds (float): Position to seek to.
+        downloaded_bytes (int): Bytes already on hand, from the start of the file.
+
+    Returns:
+        tuple[int, int]: First and last byte (None if unknown) to fetch, or None if already downloaded.
+    """
+    offset = self.offset_for(seconds)
+    if offset is None or offset < downloaded_bytes: return None
+    return offset, (self.total_bytes - 1 if self.total_bytes else None)
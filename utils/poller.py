@@ -0,0 +1,49 @@
+import threading
+import utils.scrapper as scrapper
+
+
+class FeedPoller():
+  def __init__(self, urls: list[str], cache_filename: str, on_new_entries, interval=900, max_backoff=3600) -> None:
+    """Re-scrapes the listing pages in the background, concurrently.
+
+    Args:
+        urls (list[str]): URLs of the listing pages.
+        cache_filename (str): Feed cache passed to scrapper.load_all().
+        on_new_entries (callable): Called from a polling thread with the list of new <Entries>, once per feed that has some.
+        interval (int, optional): Seconds between two polls. Defaults to 900.
+        max_backoff (int, optional): Longest delay in seconds after repeated failures. Defaults to 3600.
+    """
+    self.urls = urls
+    self.cache_filename = cache_filename
+    self.on_new_entries = on_new_entries
+    self.interval = interval
+    self.max_backoff = max_backoff
+    self.failures = 0
+    self._stopped = threading.Event()
+    self._thread = threading.Thread(target=self._run, daemon=True)
+
+
+  def start(self) -> None:
+    self._thread.start()
+
+
+  def stop(self) -> None:
+    self._stopped.set()
+
+
+  @property
+  def delay(self) -> float:
+    if not self.failures: return self.interval
+    return min(self.interval * 2 ** self.failures, max(self.max_backoff, self.interval))
+
+
+  def _on_feed_loaded(self, url: str, new_entries: list) -> None:
+    if new_entries: self.on_new_entries(new_entries)
+
+
+  def _run(self) -> None:
+    while not self._stopped.is_set():
+      try: scrapper.load_all(self.urls, self.cache_filename, self._on_feed_loaded)
+      except Exception: self.failures += 1  # Any error (ie. HTTPException, malformed item) only delays the next poll
+      else: self.failures = 0
+      self._stopped.wait(self.delay)
@@ -0,0 +1,92 @@
+import os, time, queue, threading, itertools
+import urllib.request as request
+from http.client import HTTPException
+from utils.cache import EpisodeCache
+
+
+class Prefetcher():
+  CHUNK_SIZE = 16384
+
+
+  def __init__(self, cache: EpisodeCache, workers=2, max_rate=0) -> None:
+    """Downloads episodes into <cache> in the background.
+
+    Args:
+        cache (EpisodeCache): Cache receiving the downloaded episodes.
+        workers (int, optional): Number of concurrent downloads. Defaults to 2.
+        max_rate (int, optional): Total bandwidth cap in bytes per second, 0 for none. Defaults to 0.
+    """
+    self.cache = cache
+    self.max_rate = max_rate
+    self._queue = queue.PriorityQueue()
+    self._counter = itertools.count()
+    self._generation = 0
+    self._rate_lock = threading.Lock()
+    self._rate_start = time.monotonic()
+    self._rate_bytes = 0
+    self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(workers)]
+    for thread in self._threads: thread.start()
+
+
+  def prefetch(self, urls: list[str]) -> None:
+    """Queues URLs for download, the first ones being fetched first.
+
+    Args:
+        urls (list[str]): URLs by decreasing priority.
+    """
+    for priority, url in enumerate(urls):
+      self._queue.put((priority, next(self._counter), self._generation, url))
+
+
+  def cancel(self) -> None:
+    """Drops every queued URL and aborts the downloads in progress."""
+    self._generation += 1
+    try:
+      while True: self._queue.get_nowait()
+    except queue.Empty: pass
+
+
+  def shutdown(self) -> None:
+    self.cancel()
+    for _ in self._threads: self._queue.put((-1, next(self._counter), self._generation, None))
+    for thread in self._threads: thread.join()
+
+
+  def _worker(self) -> None:
+    while True:
+      _, _, generation, url = self._queue.get()
+      if url is None: break
+      if generation != self._generation or self.cache.lookup(url, revalidate=False): continue
+      try: self._fetch(url, generation)
+      except (OSError, HTTPException): pass
+
+
+  def _fetch(self, url: str, generation: int) -> None:
+    temp_path = self.cache.temp_path(url)
+    try:
+      with request.urlopen(url, timeout=30) as response, open(temp_path, "wb") as file:
+        etag = response.headers.get("ETag")
+        length = int(response.headers.get("Content-Length", 0))
+        written = 0
+        while True:
+          if generation != self._generation: return
+          chunk = response.read(self.CHUNK_SIZE)
+          if not chunk: break
+          file.write(chunk)
+          written += len(chunk)
+          self._throttle(len(chunk))
+      if length and written != length: raise OSError(f"Prefetch of {url} ended at {written} of {length} bytes")
+      self.cache.store(url, temp_path, etag, move=True)
+    finally:
+      if os.path.exists(temp_path): os.remove(temp_path)
+
+
+  def _throttle(self, size: int) -> None:
+    if not self.max_rate: return
+    with self._rate_lock:
+      now = time.monotonic()
+      if now - self._rate_start > 1:
+        self._rate_start, self._rate_bytes = now, 0
+      self._rate_bytes += size
+      delay = self._rate_start + self._rate_bytes / self.max_rate - now
+    if delay > 0: time.sleep(delay)
@@ -0,0 +1,19 @@
+import re
+
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def parse_range(header: str, size: int) -> tuple[int, int]:
+  """Byte range (inclusive) asked by the Range <header> of a request for a <size> bytes body.
+
+  Returns None when the header is malformed or asks for several ranges, the whole body being sent
+  with a 200 then. A range starting past the end comes back with start > end, to answer with a 416.
+  """
+  match = _RANGE.fullmatch(header.strip())
+  if not match or not any(match.groups()): return None
+  first, last = match.groups()
+  if not first:  # Suffix range: the last <last> bytes, none for "bytes=-0"
+    return (max(size - int(last), 0) if int(last) else size), size - 1
+  if last and int(last) < int(first): return None
+  return int(first), min(int(last), size - 1) if last else size - 1
@@ -1,32 +1,237 @@
-import bs4, json, re
+import os, codecs, json, re, threading
 import urllib.request as request
+import urllib.error as error
+from typing import Union
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import utils.tracing as tracing
 
 
-entries = { }
+_TITLE_PATTERN = re.compile("([\\s\\S]+) ([0-9]{2}/[0-9]{2}/{0,1}[0-9]{0,}) ([\\s\\S]+)")
+_URL_TIME_PATTERN = re.compile("_([0-9]{8})_([0-9]{6})\\.mp3$")
+_TITLE_TIME_PATTERN = re.compile("([0-9]{2})/([0-9]{2})/([0-9]{4}) ([0-9]{1,2})[h:]([0-9]{2})?")
 
 
-def load(base_url: str):
-  global entries
+class Entry():
+  """A parsed <Entries> item."""
+  __slots__ = ("number", "full_title", "title", "datetime", "url", "duration")
 
-  with request.urlopen(base_url) as response: 
-    html_data = bs4.BeautifulSoup(response.read(), "html.parser")
-  list = html_data.select("div.o-layout-list script")
-  entries = [json.loads(item.contents[0]) for item in list]
-  pass
 
+  def __init__(self, number: int, item: dict) -> None:
+    self.number = number
+    self.full_title = item['diffusion']['title']
+    match = _TITLE_PATTERN.match(self.full_title)
+    if match:
+      self.title, date, time = match.groups()
+      self.datetime = f"{date} {time}"
+    else: self.title, self.datetime = self.full_title, ""
+    self.url = item['sources'][0]['url']
+    self.duration = item.get('duration')
 
-def extract_data_by_item(item: dict) -> tuple[str, str]:
+
+entries: list[Entry] = []
+index: dict[str, Entry] = {}
+feeds: dict[str, list[dict]] = {}
+validators: dict[str, dict] = {}
+_lock = threading.Lock()
+
+
+class _EntriesParser(HTMLParser):
+  """Collects the <script> payloads found under "div.o-layout-list" without building a document tree."""
+  def __init__(self) -> None:
+    super().__init__()
+    self.payloads = []
+    self._depth = 0
+    self._script = None
+
+
+  def handle_starttag(self, tag, attrs):
+    if tag == "div":
+      if self._depth: self._depth += 1
+      elif "o-layout-list" in (dict(attrs).get("class") or "").split(): self._depth = 1
+    elif tag == "script" and self._depth: self._script = []
+
+
+  def handle_endtag(self, tag):
+    if tag == "div" and self._depth: self._depth -= 1
+    elif tag == "script" and self._script is not None:
+      self.payloads.append("".join(self._script))
+      self._script = None
+
+
+  def handle_data(self, data):
+    if self._script is not None: self._script.append(data)
+
+
+def load(base_url: str, cache_filename: str = None) -> list[Entry]:
+  """Loads one listing page, sending the validators of its previous load if any, and merges it with the other feeds.
+
+  Args:
+      base_url (str): URL of the listing page.
+      cache_filename (str, optional): File where the entries of every feed are persisted. Defaults to None.
+
+  Returns:
+      list[Entry]: Entries that were not known before, empty if the server answered "304 Not Modified".
+  """
+  headers = {}
+  feed_validators = validators.get(base_url, {})
+  if feed_validators.get('etag'): headers['If-None-Match'] = feed_validators['etag']
+  if feed_validators.get('last_modified'): headers['If-Modified-Since'] = feed_validators['last_modified']
+  parser = _EntriesParser()
+  with tracing.span("scrape", url=base_url) as record:
+    size = 0
+    try:
+      with request.urlopen(request.Request(base_url, headers=headers), timeout=30) as response:
+        decoder = codecs.getincrementaldecoder(response.headers.get_content_charset() or "utf8")(errors="replace")
+        while chunk := response.read(65536):
+          size += len(chunk)
+          parser.feed(decoder.decode(chunk))
+        parser.feed(decoder.decode(b"", final=True))
+        new_validators = {'etag': response.headers.get("ETag"), 'last_modified': response.headers.get("Last-Modified")}
+    except error.HTTPError as e:
+      if e.code == 304:
+        record['status'] = 304
+        return []
+      raise
+    parser.close()
+    items = [json.loads(payload) for payload in parser.payloads]
+    for item in items: item['sources'][0]['url'], item['diffusion']['title']  # Malformed items fail this feed before it is merged
+    with _lock:
+      feeds[base_url] = items
+      validators[base_url] = new_validators
+      new_entries = _merge_feeds()
+      if cache_filename: _save_cache(cache_filename)
+    record['bytes'], record['entries'], record['new_entries'] = size, len(items), len(new_entries)
+  return new_entries
+
+
+def load_all(urls: list[str], cache_filename: str = None, on_feed_loaded=None, workers=4) -> list[Entry]:
+  """Loads several listing pages concurrently, each one being merged as soon as it arrives.
+
+  Args:
+      urls (list[str]): URLs of the listing pages.
+      cache_filename (str, optional): File where the entries are persisted. Defaults to None.
+      on_feed_loaded (callable, optional): Called from a worker thread with the URL and the new <Entries> of each loaded feed. Defaults to None.
+      workers (int, optional): Maximum concurrent requests. Defaults to 4.
+
+  Raises:
+      Exception: The first error, only when every feed failed.
+
+  Returns:
+      list[Entry]: Entries that were not known before, across all feeds.
+  """
+  new_entries, errors = [], []
+  with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) as executor:
+    futures = {executor.submit(load, url, cache_filename): url for url in urls}
+    for future in as_completed(futures):
+      try: feed_entries = future.result()
+      except Exception as e:  # Any failure (ie. HTTPException, malformed item) only concerns that feed
+        errors.append(e)
+        continue
+      new_entries += feed_entries
+      if on_feed_loaded: on_feed_loaded(futures[future], feed_entries)
+  if errors and len(errors) == len(urls): raise errors[0]
+  return new_entries
+
+
+def load_cached(urls: Union[str, list[str]], cache_filename: str) -> bool:
+  """Loads the entries persisted by the last successful load() of <urls>.
+
+  Args:
+      urls (Union[str, list[str]]): URL(s) of the listing pages.
+      cache_filename (str): File written by load().
+
+  Returns:
+      bool: True if <Entries> of at least one feed were loaded.
+  """
+  if isinstance(urls, str): urls = [urls]
+  try:
+    with open(cache_filename, "r", encoding="utf8") as file: data = json.load(fp=file)
+  except (OSError, ValueError): return False
+  if 'items' in data:  # Single feed cache written by earlier versions
+    cached_validators = dict(data.get('validators', {}))
+    data = {'feeds': {cached_validators.pop('url', None): {'validators': cached_validators, 'items': data['items']}}}
+  cached_feeds = {url: feed for url, feed in data.get('feeds', {}).items() if url in urls}
+  if not cached_feeds: return False
+  with _lock:
+    for url, feed in cached_feeds.items():
+      feeds[url] = feed['items']
+      validators[url] = feed['validators']
+    _merge_feeds()
+  return True
+
+
+def _save_cache(cache_filename: str) -> None:
+  data = {'feeds': {url: {'validators': validators.get(url, {}), 'items': items} for url, items in feeds.items()}}
+  with open(f"{cache_filename}.tmp", "w", encoding="utf8") as file: json.dump(obj=data, fp=file)
+  os.replace(f"{cache_filename}.tmp", cache_filename)
+
+
+def _broadcast_time(item: dict) -> str:
+  """Sortable "YYYYMMDDHHMMSS" broadcast time, from the audio file name or else the title ("" if unknown)."""
+  match = _URL_TIME_PATTERN.search(item['sources'][0]['url'])
+  if match: return match.group(1) + match.group(2)
+  match = _TITLE_TIME_PATTERN.search(item['diffusion']['title'])
+  if match:
+    day, month, year, hour, minute = match.groups()
+    return f"{year}{month}{day}{hour.zfill(2)}{minute or '00'}00"
+  return ""
+
+
+def _merge_feeds() -> list[Entry]:
+  """Rebuilds <entries> from every loaded feed, deduplicated by audio URL and newest first. Must hold <_lock>."""
+  merged, seen = [], set()
+  for items in feeds.values():
+    for item in items:
+      url = item['sources'][0]['url']
+      if url in seen: continue
+      seen.add(url)
+      merged.append(item)
+  merged.sort(key=_broadcast_time, reverse=True)
+  return _set_entries(merged)
+
+
+def _set_entries(items: list[dict]) -> list[Entry]:
+  global entries, index
+  known = {entry.url: entry for entry in entries}
+  new_entries, updated_entries = [], []
+  for number, item in enumerate(items):
+    entry = known.get(item['sources'][0]['url'])
+    if entry is None:
+      entry = Entry(number, item)
+      new_entries.append(entry)
+    entry.number = number
+    updated_entries.append(entry)
+  entries = updated_entries
+  index = {entry.full_title: entry for entry in entries}
+  return new_entries
+
+
+def parse_entries(html: str) -> list[dict]:
+  """Extracts <Entries> items from a listing page.
+
+  Args:
+      html (str): Listing page source.
+
+  Returns:
+      list[dict]: <Entries> items, in page order.
+  """
+  parser = _EntriesParser()
+  parser.feed(html)
+  parser.close()
+  return [json.loads(payload) for payload in parser.payloads]
+
+
+def extract_data_by_item(item: Entry) -> tuple[str, str]:
   """Extract title and datetime from an <Entries> item.
 
   Args:
-      item (dict): <Entries> item.
+      item (Entry): <Entries> item.
 
   Returns:
       tuple[str, str]: Tuple including title, datetime.
   """
-  groups = re.findall("([\\s\\S]+) ([0-9]{2}/[0-9]{2}/{0,1}[0-9]{0,}) ([\\s\\S]+)", item['diffusion']['title'])
-  title, date, time = groups[0]
-  return title, f"{date} {time}"
+  return item.title, item.datetime
 
 
 def extract_data_by_number(entry_number: int) -> tuple[str, str]:
@@ -38,9 +243,19 @@ def extract_data_by_number(entry_number: int) -> tuple[str, str]:
   Returns:
       tuple[str, str]: Tuple including title, datetime.
   """
-  groups = re.findall("([\\s\\S]+) ([0-9]{2}/[0-9]{2}/{0,1}[0-9]{0,}) ([\\s\\S]+)", entries[entry_number]['diffusion']['title'])
-  title, date, time = groups[0]
-  return title, f"{date} {time}"
+  return extract_data_by_item(entries[entry_number])
+
+
+def entry_by_title(title: str) -> Entry:
+  """Looks up an entry from its title.
+
+  Args:
+      title (str): EXACT title of the show.
+
+  Returns:
+      Entry: <Entries> item.
+  """
+  return index[title]
 
 
 def entry_number_by_title(title: str) -> int:
@@ -52,7 +267,7 @@ def entry_number_by_title(title: str) -> int:
   Returns:
       int: <Entries> index.
   """
-  return [i for i in range(len(entries)) if entries[i]['diffusion']['title'] == title][0]
+  return index[title].number
 
 
 def extract_url(entry_number: int) -> str:
@@ -64,5 +279,4 @@ def extract_url(entry_number: int) -> str:
   Returns:
       str: the URL of the show.
   """
-  entry = entries[entry_number] 
-  return entry['sources'][0]['url']
+  return entries[entry_number].url
@@ -2,18 +2,36 @@ import os, json
 
 
 __settings_file__ = "settings.json"
+DAEMON_LISTING_PATH = "/journaux/"  # Merged listing page served by daemon.py
 
 json_settings = {
   "url": "https://www.rfi.fr/fr/journaux-monde/",
+  "urls": [],
   "location": (1612, 0),
   "theme": "DarkGrey12",
+  "feed_cache": "feed.json",
+  "startup_budget": 2.0,
+  "poll_interval": 900,
+  "poll_max_backoff": 3600,
+  "backend": "auto",
+  "buffer_threshold": 262144,
+  "cache_dir": "cache",
+  "cache_max_bytes": 524288000,
+  "cache_max_age": 604800,
+  "prefetch_count": 3,
+  "prefetch_workers": 2,
+  "prefetch_max_rate": 262144,
+  "trace": False,
+  "trace_file": "trace.jsonl",
+  "trace_max_bytes": 1048576,
+  "trace_backups": 3,
+  "daemon": "",
 }
 
 
 def load_settings():
-  global json_settings
   if os.path.exists(__settings_file__):
-    with open(__settings_file__, "r") as file: json_settings = json.load(fp=file)
+    with open(__settings_file__, "r") as file: json_settings.update(json.load(fp=file))
   else: save_settings()
 
 
@@ -21,6 +39,11 @@ def save_settings():
   with open(__settings_file__, "w") as file: json.dump(obj=json_settings, fp=file, indent=2)
 
 
+def feed_urls() -> list[str]:
+  """Listing pages to scrape: <urls> if set, else the single <url> of earlier settings files."""
+  return json_settings['urls'] or [json_settings['url']]
+
+
 def set_setting(key: str, value: str):
   global json_settings
   json_settings[key] = value
\ No newline at end of file
@@ -0,0 +1,53 @@
+import tkinter as tk
+import PySimpleGUI as sg
+
+
+_themes = tuple(sg.theme_list())
+_indexes = {name: index for index, name in enumerate(_themes)}
+
+
+def theme_list() -> tuple[str]:
+  """Same as sg.theme_list(), computed once."""
+  return _themes
+
+
+def theme_index(name: str) -> int:
+  return _indexes[name]
+
+
+def relative_theme(name: str, step: int) -> str:
+  """Returns the theme <step> places away from <name>, wrapping around the list."""
+  return _themes[(_indexes[name] + step) % len(_themes)]
+
+
+def apply_theme(window: sg.Window, name: str) -> None:
+  """Sets the current theme and restyles the elements of an existing window instead of recreating it.
+
+  Args:
+      window (sg.Window): Finalized window to restyle.
+      name (str): Theme name.
+  """
+  sg.theme(name)
+  background = sg.theme_background_color()
+  text = sg.theme_text_color()
+  input_background, input_text = sg.theme_input_background_color(), sg.theme_input_text_color()
+
+  _set_background(window.TKroot, background)
+  for element in window.element_list():
+    if isinstance(element, (sg.Text, sg.StatusBar)):
+      element.update(background_color=sg.theme_text_element_background_color(), text_color=text)
+    elif isinstance(element, sg.ButtonMenu):
+      element.Widget.configure(background=background, foreground=text, activebackground=text, activeforeground=background)
+      element.TKMenu.configure(background=input_background, foreground=input_text)
+    elif isinstance(element, sg.Button):
+      element.update(button_color=sg.theme_button_color())
+    elif isinstance(element, sg.Slider):
+      element.Widget.configure(background=background, foreground=text, troughcolor=sg.theme_slider_color(), highlightbackground=background)
+    elif isinstance(element, sg.Combo):
+      element.update(background_color=input_background, text_color=input_text)
+  window.refresh()
+
+
+def _set_background(widget: tk.Misc, color: str) -> None:
+  if isinstance(widget, (tk.Tk, tk.Toplevel, tk.Frame, tk.Canvas)): widget.configure(background=color)
+  for child in widget.winfo_children(): _set_background(child, color)
@@ -0,0 +1,48 @@
+import os, sys, json, time, contextlib
+
+
+_start = time.perf_counter()
+enabled = "--timeline" in sys.argv or bool(os.environ.get("RFI_TIMELINE"))
+exit_after_first_window = "--exit-after-first-window" in sys.argv
+spans = []
+
+
+@contextlib.contextmanager
+def span(name: str):
+  """Records how long the enclosed block takes, relative to process start, when the timeline is enabled."""
+  if not enabled:
+    yield
+    return
+  start = time.perf_counter()
+  try: yield
+  finally: spans.append({'name': name, 'start': start - _start, 'end': time.perf_counter() - _start})
+
+
+def mark(name: str) -> None:
+  """Records an instant (ie. "first window")."""
+  if not enabled: return
+  now = time.perf_counter() - _start
+  spans.append({'name': name, 'start': now, 'end': now})
+
+
+def elapsed(name: str) -> float:
+  """Seconds from process start to the end of the <name> span, None if it was not recorded."""
+  return next((item['end'] for item in spans if item['name'] == name), None)
+
+
+def report(filename="startup_timeline.json", budget: float = None) -> bool:
+  """Writes the recorded spans as JSON and prints them when a console is attached.
+
+  Args:
+      filename (str, optional): Output file. Defaults to "startup_timeline.json".
+      budget (float, optional): Seconds allowed until the "first window" mark. Defaults to None.
+
+  Returns:
+      bool: False if the first window came later than <budget>.
+  """
+  first_window = elapsed("first window")
+  within_budget = budget is None or (first_window is not None and first_window <= budget)
+  with open(filename, "w") as file: json.dump(obj={'spans': spans, 'first_window': first_window, 'budget': budget, 'within_budget': within_budget}, fp=file, indent=2)
+  if sys.stderr:
+    for item in spans: print(f"{item['start'] * 1000:8.1f} ms {(item['end'] - item['start']) * 1000:8.1f} ms  {item['name']}", file=sys.stderr)
+  return within_budget
@@ -0,0 +1,96 @@
+import os, sys, json, time, logging, threading, contextlib, collections
+from logging.handlers import RotatingFileHandler
+
+
+enabled = "--trace" in sys.argv or bool(os.environ.get("RFI_TRACE"))
+recent = collections.deque(maxlen=500)
+_logger = logging.getLogger("rfi.trace")
+_logger.propagate = False
+
+
+class _NullRecord(dict):
+  """Shared record handed out by span() while tracing is disabled, drops whatever is set on it."""
+  def __setitem__(self, key, value): pass
+
+
+_null_record = _NullRecord()
+
+
+def configure(filename="trace.jsonl", max_bytes=1048576, backup_count=3, enable=False) -> None:
+  """Enables tracing if asked by <enable>, "--trace" or RFI_TRACE, and attaches the rotating JSON lines log.
+
+  Args:
+      filename (str, optional): Log file. Defaults to "trace.jsonl".
+      max_bytes (int, optional): Size at which the log is rotated. Defaults to 1048576.
+      backup_count (int, optional): Rotated files kept. Defaults to 3.
+      enable (bool, optional): Setting value, command line and environment are honoured as well. Defaults to False.
+  """
+  global enabled
+  enabled = enabled or enable
+  if not enabled or _logger.handlers: return
+  handler = RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf8")
+  handler.setFormatter(logging.Formatter("%(message)s"))
+  _logger.addHandler(handler)
+  _logger.setLevel(logging.INFO)
+
+
+def emit(record: dict) -> None:
+  recent.append(record)
+  if _logger.handlers: _logger.info(json.dumps(record, default=str))
+
+
+@contextlib.contextmanager
+def span(name: str, min_seconds=0.0, **fields):
+  """Times the enclosed block and yields its record, where the block can add fields (ie. "bytes").
+
+  Records faster than <min_seconds> are dropped unless the block raised. Costs a single check when disabled.
+  """
+  if not enabled:
+    yield _null_record
+    return
+  record = {'name': name, 'time': time.time(), 'thread': threading.current_thread().name, **fields}
+  start = time.perf_counter()
+  try: yield record
+  except BaseException as e:
+    record['error'] = repr(e)
+    raise
+  finally:
+    record['seconds'] = time.perf_counter() - start
+    if record['seconds'] >= min_seconds or 'error' in record: emit(record)
+
+
+def event(name: str, seconds: float = None, **fields) -> None:
+  """Records something already measured (ie. a duration spanning several UI events)."""
+  if not enabled: return
+  emit({'name': name, 'time': time.time(), 'thread': threading.current_thread().name, 'seconds': seconds, **fields})
+
+
+class TracedBackend():
+  """Wraps an AudioBackend so that each call is recorded as "backend.<method>".
+
+  Polling calls (position, status...) run on every UI tick and are only recorded when slower than <slow_query>.
+  """
+  _QUERIES = ("position", "length", "status", "get_volume")
+
+
+  def __init__(self, backend, slow_query=0.005) -> None:
+    self._backend = backend
+    self._name = type(backend).__name__
+    self._slow_query = slow_query
+
+
+  def __getattr__(self, name: str):
+    attribute = getattr(self._backend, name)
+    if not callable(attribute): return attribute
+    min_seconds = self._slow_query if name in self._QUERIES else 0.0
+
+    def call(*args):
+      with span(f"backend.{name}", min_seconds, backend=self._name) as record:
+        if args and isinstance(args[0], (bytes, bytearray)): record['bytes'] = len(args[0])
+        return attribute(*args)
+    return call
+
+
+def traced_backend(backend):
+  """Returns <backend> wrapped in a TracedBackend when tracing is enabled, unchanged otherwise."""
+  return TracedBackend(backend) if enabled else backend
@@ -0,0 +1,52 @@
+import statistics
+import PySimpleGUI as sg
+import utils.tracing as tracing
+
+
+class DiagnosticsWindow():
+  HEADINGS = ["Phase", "ms", "Bytes", "Thread", "Error"]
+
+
+  def __init__(self, parent_window: sg.Window):
+    self.parent_window = parent_window
+    self.window = self._create_window()
+
+    while(True):
+      event, values = self.window.read()
+      #print(event, values)
+
+      if event in (sg.WIN_CLOSED, "close_button"):
+        self.window.close()
+        break
+      if event == "refresh_button":
+        self.window['spans'].update(values=self._span_rows())
+        self.window['summary'].update(values=self._summary_rows())
+
+
+  def _create_window(self) -> sg.Window:
+    layout = [
+      [sg.Table(self._summary_rows(), headings=["Phase", "Count", "Median ms", "Max ms"], key="summary", num_rows=6, auto_size_columns=False, col_widths=[22, 8, 10, 10], expand_x=True)],
+      [sg.Table(self._span_rows(), headings=self.HEADINGS, key="spans", num_rows=15, auto_size_columns=False, col_widths=[22, 10, 10, 16, 20], expand_x=True, expand_y=True)],
+      [sg.Button("Rafraîchir", key="refresh_button"), sg.Button("Fermer", key="close_button", font=("", 10, "bold"), focus=True)]
+    ]
+    return sg.Window(title="Diagnostics", layout=layout, modal=True, resizable=True, location=self._set_location(), finalize=True)
+
+
+  def _set_location(self) -> tuple[int, int]:
+    parent_size_y = self.parent_window.size[1]
+    parent_location_x, parent_location_y = self.parent_window.CurrentLocation()
+    return (parent_location_x, parent_location_y + parent_size_y + 35)
+
+
+  def _span_rows(self) -> list[list]:
+    return [
+      [record['name'], f"{record['seconds'] * 1000:.1f}" if record.get('seconds') is not None else "", record.get('bytes', ""), record.get('thread', ""), record.get('error', "")]
+      for record in reversed(list(tracing.recent))
+    ]
+
+
+  def _summary_rows(self) -> list[list]:
+    durations = {}
+    for record in list(tracing.recent):
+      if record.get('seconds') is not None: durations.setdefault(record['name'], []).append(record['seconds'] * 1000)
+    return [[name, len(values), f"{statistics.median(values):.1f}", f"{max(values):.1f}"] for name, values in sorted(durations.items())]
@@ -1,46 +1,78 @@
 import time
+import urllib.request as request
 import PySimpleGUI as sg
 import utils.images as images
 import utils.scrapper as scrapper
 import utils.settings as settings
+import utils.timeline as timeline
+import utils.themes as themes
+import utils.tracing as tracing
 from windows.themepicker import ThemePickerWindow
-from utils.mp3handler import MP3Handler
+from windows.diagnostics import DiagnosticsWindow
+from utils.mp3handler import MP3Handler, PlayerState
+from utils.backends import SimulatedBackend, create_backend
+from utils.cache import EpisodeCache
+from utils.prefetcher import Prefetcher
+from utils.poller import FeedPoller
 
 
 window_title = ""
+NEWS_MENU = "&Les journaux Monde"
 font = "Lucida"
 theme = settings.json_settings['theme']
 location = settings.json_settings['location']
 window: sg.Window = None
 mp3handler: MP3Handler = None
+cache: EpisodeCache = None
+prefetcher: Prefetcher = None
+poller: FeedPoller = None
+use_daemon = False
+silent_backend = False
 playpause = images.base64_play
 title_str = "N/A"
 datetime_str = "N/A"
 timer_str = "00:00 / 00:00"
 progressbar_values = {'actual': 0, 'max': 0}
 statusbar_str = "{}".format(' ' * 40)
-
-scrapper.load(settings.json_settings['url'])
+tick_timeout = 100
+tick_counters = {'ticks': 0, 'backend_calls': 0, 'last_backend_calls': 0, 'last_tick_ms': 0.0, 'max_tick_ms': 0.0}
+_rendered = {}
 
 
 def show():
-  global window, mp3handler, location, timer_str
+  global window, mp3handler, cache, prefetcher, poller, location, use_daemon
 
-  window = _create_window()
+  with timeline.span("open cache"):
+    if cache is None: cache = EpisodeCache(settings.json_settings['cache_dir'], settings.json_settings['cache_max_bytes'], settings.json_settings['cache_max_age'])
+    if prefetcher is None: prefetcher = Prefetcher(cache, settings.json_settings['prefetch_workers'], settings.json_settings['prefetch_max_rate'])
+  with timeline.span("load feed"):
+    use_daemon = _daemon_available()
+    if not scrapper.load_cached(_feed_urls(), settings.json_settings['feed_cache']):
+      scrapper.load(_feed_urls()[0], settings.json_settings['feed_cache'])  # The poller brings the other feeds
+  with timeline.span("create window"): window = _create_window()
+  timeline.mark("first window")
+  if timeline.exit_after_first_window:
+    window.close()
+    return
+  poller = FeedPoller(_feed_urls(), settings.json_settings['feed_cache'], _on_new_entries, settings.json_settings['poll_interval'], settings.json_settings['poll_max_backoff'])
+  poller.start()
   _load_new_MP3()
   location = window.CurrentLocation()
 
   while True:
-    event, values = window.read(100)
+    event, values = window.read(tick_timeout)
     #print(event, values)
 
-    if event == "__TIMEOUT__":
-      if mp3handler.Position == mp3handler.Length: window['stop'].click()
-      else:
-        try: timer_str = f"{time.strftime('%M:%S', time.gmtime(mp3handler.Position))} / {time.strftime('%M:%S', time.gmtime(mp3handler.Length))}"
-        except: timer_str = "00:00 / 00:00"
-        _update_window(timer=True, progress_slider=True)
+    if not mp3handler.loaded and event in ("__TIMEOUT__", "Left:37", "Right:39", "playpause", "stop", "rewind", "forward", "progress_slider", "volumeslider"): continue
+    if event == "__TIMEOUT__": _on_tick()
+    if event == "mp3_progress":
+      _on_mp3_progress(values['mp3_progress'])
+    if event == "feed_updated":
+      window[NEWS_MENU.replace('&', '')].update(menu_definition=_menubar_definition()[0])  # MenubarCustom is a Column, its ButtonMenus are keyed by label
     if event == sg.WIN_CLOSED:
+      poller.stop()
+      prefetcher.cancel()
+      mp3handler.close()
       del mp3handler
       break
     if event == "Left:37":
@@ -67,14 +99,16 @@ def show():
     if values['menubar']:
       menubar_item = f"{str(values['menubar']).split('::')[0]}"
       if str(values['menubar']).find("_NEWS_") != -1:
-        _load_new_MP3(scrapper.entry_number_by_title(menubar_item))
+        _load_new_MP3(scrapper.entry_by_title(menubar_item))
       if str(values['menubar']).find("_THEME_") != -1:
         ThemePickerWindow(window)
-        window.close()
-        window = _create_window()
+        themes.apply_theme(window, sg.theme())
+      if str(values['menubar']).find("_DIAGNOSTICS_") != -1:
+        DiagnosticsWindow(window)
 
 
 def _create_window() -> sg.Window:
+  _rendered.clear()
   col1 = sg.Column([
     [sg.Button(key="playpause", border_width=0, image_data=playpause), sg.Button(key="stop", border_width=0, image_data=images.base64_stop)],
     [sg.Button(key="rewind", border_width=0, image_data=images.base64_rewind), sg.Button(key="forward", border_width=0, image_data=images.base64_forward)],
@@ -89,13 +123,8 @@ def _create_window() -> sg.Window:
     [sg.Slider(range=(0, 100), key="volumeslider", default_value=100, enable_events=True, size=(3, 10), pad=(0, 5), orientation="vertical", disable_number_display=False, relief=sg.RELIEF_FLAT)],
   ], vertical_alignment="top", pad=(0, 0))
 
-  menubar = [
-    ["&Les journaux Monde", [ ["{} {}::_NEWS_".format(*scrapper.extract_data_by_item(item)) for item in scrapper.entries] ]],
-    ["&Themes", ["Select new theme::_THEME_"]]
-  ]
-
   layout = [
-    [sg.MenubarCustom(menubar, key="menubar", bar_font=("", 10), bar_background_color=sg.theme_background_color(), bar_text_color=sg.theme_text_color())],
+    [sg.MenubarCustom(_menubar_definition(), key="menubar", bar_font=("", 10), bar_background_color=sg.theme_background_color(), bar_text_color=sg.theme_text_color())],
     [sg.HorizontalSeparator()],
     [sg.Text(title_str, key="title", font=("", 20, "bold"), justification="center", expand_x=True, pad=(0, 0))],
     [sg.Text(datetime_str, key="datetime", font=("", 14, "italic"), justification="center", expand_x=True, pad=(0, 0))],
@@ -107,37 +136,101 @@ def _create_window() -> sg.Window:
   return sg.Window(window_title, font=font, layout=layout, return_keyboard_events=True, location=location, finalize=True)
 
 
-def _update_window(metadata=False, timer=False, progress_slider=False, volumeslider=False, playpause=False, statusbar=False):
+def _daemon_available() -> bool:
+  """True if the shared daemon (daemon.py) is configured and answers."""
+  if not settings.json_settings['daemon']: return False
+  try:
+    with request.urlopen(request.Request(settings.json_settings['daemon'] + settings.DAEMON_LISTING_PATH, method="HEAD"), timeout=1): return True
+  except OSError: return False
+
+
+def _feed_urls() -> list[str]:
+  return [settings.json_settings['daemon'] + settings.DAEMON_LISTING_PATH] if use_daemon else settings.feed_urls()
+
+
+def _menubar_definition() -> list:
+  return [
+    [NEWS_MENU, [ [f"{entry.full_title}::_NEWS_" for entry in scrapper.entries] ]],
+    ["&Themes", ["Select new theme::_THEME_"]],
+    *([["&Diagnostics", ["Timings::_DIAGNOSTICS_"]]] if tracing.enabled else []),
+  ]
+
+
+def _on_new_entries(new_entries: list):
+  window.write_event_value("feed_updated", new_entries)
+
+
+def _on_tick():
+  global timer_str, tick_timeout
+
+  tick_start = time.perf_counter()
+  backend_calls = mp3handler.backend_calls
+  state = mp3handler.snapshot()
+  mp3handler.update_buffer(state)
+  if mp3handler.Underrun: _update_buffer_status()
+  elif state.position == state.length and not mp3handler.Downloading: window['stop'].click()
+  else:
+    timer_str = f"{time.strftime('%M:%S', time.gmtime(state.position))} / {time.strftime('%M:%S', time.gmtime(state.duration))}"
+    _update_window(timer=True, progress_slider=True, state=state)
+  tick_timeout = 100 if state.status == mp3handler.STATUS_PLAYING else 500
+
+  tick_ms = (time.perf_counter() - tick_start) * 1000
+  tick_counters['ticks'] += 1
+  tick_counters['last_backend_calls'] = mp3handler.backend_calls - backend_calls
+  tick_counters['backend_calls'] += tick_counters['last_backend_calls']
+  tick_counters['last_tick_ms'] = tick_ms
+  tick_counters['max_tick_ms'] = max(tick_counters['max_tick_ms'], tick_ms)
+
+
+def _update_element(key: str, **kwargs) -> bool:
+  if _rendered.get((key, *kwargs)) == kwargs: return False
+  _rendered[(key, *kwargs)] = kwargs
+  window[key].update(**kwargs)
+  return True
+
+
+def _update_window(metadata=False, timer=False, progress_slider=False, volumeslider=False, playpause=False, statusbar=False, state: PlayerState = None):
   global statusbar_str
+  if state is None and (progress_slider or playpause): state = mp3handler.snapshot()
+  changed = False
   if metadata:
-    window['title'].update(title_str)
-    window['datetime'].update(datetime_str)
-  if timer: window['mp3time'].update(timer_str)
+    changed |= _update_element('title', value=title_str)
+    changed |= _update_element('datetime', value=datetime_str)
+  if timer: changed |= _update_element('mp3time', value=timer_str)
   if progress_slider:
-    if mp3handler.Status == mp3handler.STATUS_PLAYING: window['progress_slider'].update(disabled=False)
-    if mp3handler.Status == mp3handler.STATUS_PAUSED: window['progress_slider'].update(disabled=True)
-    if mp3handler.Status == mp3handler.STATUS_STOPPED: window['progress_slider'].update(disabled=True)
-    try: window['progress_slider'].update(range=(0, mp3handler.Length), value=mp3handler.Position)
-    except: window['progress_slider'].update(range=(0, 0), value=0)
-  if volumeslider: window['volumeslider'].update(mp3handler.Volume)
+    changed |= _update_element('progress_slider', disabled=state.status != mp3handler.STATUS_PLAYING)
+    changed |= _update_element('progress_slider', range=(0, state.duration), value=state.position)
+  if volumeslider: changed |= _update_element('volumeslider', value=mp3handler.Volume)
   if playpause:
-    if mp3handler.Status == mp3handler.STATUS_PLAYING:
+    if state.status == mp3handler.STATUS_PLAYING:
       playpause = images.base64_pause
       statusbar_str = "Playing..."
-    if mp3handler.Status == mp3handler.STATUS_PAUSED:
+    if state.status == mp3handler.STATUS_PAUSED:
       playpause = images.base64_play
       statusbar_str = "Paused..."
-    if mp3handler.Status == mp3handler.STATUS_STOPPED:
+    if state.status == mp3handler.STATUS_STOPPED:
       playpause = images.base64_play
       statusbar_str = "Stopped..."
-    window['playpause'].update(image_data=playpause)
-  if statusbar: window['statusbar'].update(statusbar_str)
-  window.refresh()
+    if silent_backend: statusbar_str += " (no audio output: install pygame or check the sound device)"
+    changed |= _update_element('playpause', image_data=playpause)
+  if statusbar: changed |= _update_element('statusbar', value=statusbar_str)
+  if changed: window.refresh()
+
+
+def _update_buffer_status():
+  global statusbar_str
+  statusbar_str = f"Buffering... {mp3handler.BufferLevel}% (underruns: {mp3handler.underruns})"
+  _update_window(statusbar=True)
 
 
-def _load_new_MP3(entry_number=0):
-  global mp3handler, statusbar_str, timer_str, title_str, datetime_str
+def _load_new_MP3(entry: scrapper.Entry = None):
+  """Plays <entry> (the newest one by default), resolved once so that a concurrent feed update cannot mix two bulletins."""
+  global mp3handler, statusbar_str, timer_str, title_str, datetime_str, silent_backend
 
+  if entry is None: entry = scrapper.entries[0]
+
+  prefetcher.cancel()
+  if mp3handler: mp3handler.close()
   del mp3handler
   statusbar_str = "Loading new MP3..."
   timer_str = "00:00 / 00:00"
@@ -146,18 +239,45 @@ def _load_new_MP3(entry_number=0):
   _update_window(statusbar=True, timer=True, metadata=True)
 
   statusbar_str = "Extracting data..."
-  title_str, datetime_str = scrapper.extract_data_by_number(entry_number)
+  with tracing.span("extract", entry=entry.number): title_str, datetime_str = scrapper.extract_data_by_item(entry)
   _update_window(statusbar=True, metadata=True)
   window.move(settings.json_settings['location'][0] - window.size[0], settings.json_settings['location'][1])
 
-  statusbar_str = "Downloading..."
-  mp3handler = MP3Handler(scrapper.extract_url(entry_number))
-  mp3handler.download_MP3()
-  _update_window(statusbar=True, timer=True)
-
-  statusbar_str = "Loading..."
-  mp3handler.load_MP3()
+  statusbar_str = "Connecting..."
   _update_window(statusbar=True)
-  
-  playpause_button: sg.Button = window['playpause']
-  playpause_button.click()
\ No newline at end of file
+  backend = create_backend(settings.json_settings['backend'])
+  silent_backend = isinstance(backend, SimulatedBackend) and settings.json_settings['backend'] != "simulated"
+  mp3handler = MP3Handler(entry.url, buffer_threshold=settings.json_settings['buffer_threshold'], cache=None if use_daemon else cache, on_progress=_post_mp3_progress, backend=tracing.traced_backend(backend))
+  mp3handler.start_stream()
+
+
+def _prefetch_newest():
+  """Queues the newest episodes once playback started, so that they do not slow down the buffering."""
+  if use_daemon: return  # The daemon caches and prefetches for every player
+  prefetch_count = min(settings.json_settings['prefetch_count'], len(scrapper.entries))
+  prefetcher.prefetch([entry.url for entry in scrapper.entries[:prefetch_count] if entry.url != mp3handler.mp3_url])
+
+
+def _post_mp3_progress(handler: MP3Handler):
+  window.write_event_value("mp3_progress", handler)
+
+
+def _on_mp3_progress(handler: MP3Handler):
+  global statusbar_str
+
+  if handler is not mp3handler: return
+  if mp3handler.Error:
+    statusbar_str = f"Download failed: {mp3handler.Error}"
+    _update_window(statusbar=True)
+  elif not mp3handler.loaded and mp3handler.Buffered:
+    statusbar_str = "Loading..."
+    _update_window(statusbar=True)
+    mp3handler.load_MP3()
+    playpause_button: sg.Button = window['playpause']
+    playpause_button.click()
+    _prefetch_newest()
+  elif mp3handler.Downloading:
+    downloaded = f"{mp3handler.downloaded_bytes // 1024} KiB ({mp3handler.BufferLevel}%)" if mp3handler.total_bytes else f"{mp3handler.downloaded_bytes // 1024} KiB"
+    statusbar_str = f"{'Buffering' if not mp3handler.loaded else 'Downloading'}... {downloaded} - {mp3handler.Throughput / 1024:.0f} KiB/s - {time.strftime('%M:%S', time.gmtime(mp3handler.ETA))} left"
+    _update_window(statusbar=True)
+  elif mp3handler.loaded: _update_window(playpause=True, statusbar=True)
\ No newline at end of file
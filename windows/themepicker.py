@@ -1,5 +1,6 @@
 import PySimpleGUI as sg
 import utils.settings as settings
+import utils.themes as themes
 
 
 class ThemePickerWindow():
@@ -17,23 +18,23 @@ class ThemePickerWindow():
         break
       if event == "Down:40": self._next_theme()
       if event == "Up:38": self._previous_theme()
-      if event == "new_theme":
-        sg.theme(values['new_theme'])
-        self._refresh_window()
+      if event == "new_theme": self._preview_theme(values['new_theme'])
 
 
   def _create_window(self) -> sg.Window:
     layout = [
       [sg.Text(self._set_theme_label(), key="theme_label", expand_x=True, justification="center")],
-      [sg.Combo(sg.theme_list(), key="new_theme", default_value=sg.theme(), expand_x=True, change_submits=True)],
+      [sg.Combo(themes.theme_list(), key="new_theme", default_value=sg.theme(), expand_x=True, change_submits=True)],
       [sg.Ok(button_text="Sauvegarder", key="save_button", font=("", 10, "bold"), focus=True)]
     ]
     return sg.Window(title="Select a new theme...", layout=layout, modal=True, return_keyboard_events=True, use_custom_titlebar=False, disable_close=True, disable_minimize=True, size=self._set_size(), location=self._set_location(), auto_size_buttons=False, default_button_element_size=(10, 0))
 
 
-  def _refresh_window(self):
-    self.window.close()
-    self.window = self._create_window()
+  def _preview_theme(self, new_theme: str):
+    themes.apply_theme(self.window, new_theme)
+    themes.apply_theme(self.parent_window, new_theme)
+    self.window['new_theme'].update(value=new_theme)
+    self._set_theme_label(update=True)
 
 
   def _set_size(self) -> tuple[int, int]:
@@ -51,8 +52,8 @@ class ThemePickerWindow():
   
 
   def _set_theme_label(self, update=False):
-    position = sg.theme_list().index(sg.theme()) + 1
-    count = len(sg.theme_list())
+    position = themes.theme_index(sg.theme()) + 1
+    count = len(themes.theme_list())
     label_text = f"Theme {position}/{count}"
     if update:
       self.window['theme_label'].update(label_text)
@@ -61,17 +62,8 @@ class ThemePickerWindow():
 
 
   def _next_theme(self):
-    combo: sg.Combo = self.window['new_theme']
-    current_index = sg.theme_list().index(combo.DefaultValue)
-    try: new_theme = sg.theme_list()[current_index+1]
-    except IndexError: new_theme = sg.theme_list()[0]
-    sg.theme(new_theme)
-    self._refresh_window()
+    self._preview_theme(themes.relative_theme(sg.theme(), 1))
 
 
   def _previous_theme(self):
-    combo: sg.Combo = self.window['new_theme']
-    current_index = sg.theme_list().index(combo.DefaultValue)
-    new_theme = sg.theme_list()[current_index-1]
-    sg.theme(new_theme)
-    self._refresh_window()
\ No newline at end of file
+    self._preview_theme(themes.relative_theme(sg.theme(), -1))
\ No newline at end of file